@@ -0,0 +1,615 @@
+"""
+In-memory stand-in for the parts of Maya used by the Light Manager.
+
+`install()` registers fake `maya`, `maya.cmds`, `maya.api.OpenMaya` and
+`mtoa.utils` modules, so that the manager can be imported and exercised
+outside Maya (e.g. by `benchmark.py`, under an offscreen Qt platform). The
+fake only implements the subset of commands and flags the manager uses, on a
+scene of light shapes under their transforms, which can be parented under groups.
+As in Maya, a short name is only unique among siblings: nodes under different
+parents may share it, and then have to be named by a (partial) DAG path.
+"""
+import itertools
+import sys
+import types
+import uuid
+
+LIGHT_TYPES = ("aiPhotometricLight", "aiSkyDomeLight", "aiAreaLight", "spotLight", "pointLight", "directionalLight")
+# DEFAULT ATTRIBUTE VALUES PER NODE TYPE
+TRANSFORM_ATTRIBUTES = {"visibility": True}
+LIGHT_ATTRIBUTES = {"color": (1.0, 1.0, 1.0), "intensity": 1.0, "aiExposure": 0.0, "aiSamples": 1, "aiAov": "default"}
+
+
+class FakeNode:
+    """ One node of the fake scene. """
+
+    def __init__(self, name: str, node_type: str, parent: "FakeNode" = None, attributes: dict = None):
+        self.name = name
+        self.node_type = node_type
+        self.parent = parent
+        self.children = []
+        self.attributes = dict(attributes or {})
+        self.uuid = str(uuid.uuid4()).upper()
+        if parent is not None:
+            parent.children.append(self)
+
+    @property
+    def path(self) -> str:
+        """ The full DAG path of the node ('' for non-DAG nodes). """
+        if self.node_type == "network":
+            return self.name
+        return (self.parent.path if self.parent else "") + "|" + self.name
+
+
+class FakeScene:
+    """
+    The fake scene graph, with the `cmds` functions it backs.
+
+    Every call made through `cmds` is counted in `calls`, and the undo chunks
+    opened through `undoInfo` in `undo_chunks`.
+    """
+
+    def __init__(self):
+        self.nodes = {}  # SHORT NAME -> [FakeNode, ...] (SIBLINGS NEVER SHARE A NAME, OTHER NODES MAY)
+        self.selection = []  # SELECTED FakeNodes, IN ORDER
+        self.script_jobs = {}  # JOB ID -> (NODE, ATTRIBUTE, FUNCTION)
+        self.node_jobs = {}  # NODE -> {JOB ID}, SO THAT A WRITE ONLY LOOKS AT THE JOBS OF ITS NODE
+        self.job_ids = itertools.count(1)
+        # CALLBACK ID -> (KIND, TARGET: NODE, None FOR ANY NODE, NODE TYPE OR SCENE MESSAGE, FUNCTION)
+        self.callbacks = {}
+        self.watchers = {}  # (KIND, TARGET) -> {CALLBACK ID: FUNCTION}, THE SAME CALLBACKS INDEXED
+        self.callback_ids = itertools.count(1)
+        self.undo_depth = 0
+        self.undo_chunks = []  # NAMES OF THE OUTERMOST UNDO CHUNKS OPENED
+        self.calls = {}  # COMMAND NAME -> NUMBER OF CALLS
+
+    # SCENE BUILDING --------------------------------------------
+    def unique_name(self, name: str, parent: FakeNode = None) -> str:
+        """
+        Returns `name`, or `name` with the first free numeric suffix, like Maya does on collision.
+
+        Only the children of `parent` (the nodes at the root of the scene if None) collide.
+        """
+        def _taken(candidate: str) -> bool:
+            return any(node.parent is parent for node in self.nodes.get(candidate, ()))
+
+        if not _taken(name):
+            return name
+        base = name.rstrip("0123456789")
+        for index in itertools.count(1):
+            if not _taken(f"{base}{index}"):
+                return f"{base}{index}"
+
+    def add_node(self, node: FakeNode):
+        self.nodes.setdefault(node.name, []).append(node)
+
+    def drop_node(self, node: FakeNode):
+        namesakes = self.nodes.get(node.name, [])
+        if node in namesakes:
+            namesakes.remove(node)
+            if not namesakes:
+                del self.nodes[node.name]
+
+    def exists(self, node: FakeNode) -> bool:
+        """ True if the node is part of the scene (not deleted). """
+        return node in self.nodes.get(node.name, ())
+
+    def all_nodes(self) -> list:
+        return [node for namesakes in self.nodes.values() for node in namesakes]
+
+    def create_light(self, light_type: str, name: str = None, parent: str = None) -> tuple:
+        """
+        Creates a transform and its light shape, optionally under a group; returns their (shape, transform) paths.
+        """
+        group = None if parent is None else self.node(parent)
+        transform = FakeNode(self.unique_name(name or light_type, group), "transform", group, TRANSFORM_ATTRIBUTES)
+        self.add_node(transform)
+        shape = FakeNode(self.unique_name(f"{transform.name}Shape", transform), light_type, transform,
+                         LIGHT_ATTRIBUTES)
+        self.add_node(shape)
+        self.run_callbacks("added", light_type, MObject(shape), None)
+        return shape.path, transform.path
+
+    def populate(self, count: int, light_types: tuple = LIGHT_TYPES):
+        """ Adds `count` lights named LGT_<TYPE>_###, cycling through the light types. """
+        for index in range(count):
+            light_type = light_types[index % len(light_types)]
+            self.create_light(light_type, f"LGT_{light_type.upper()}_{index:03d}")
+
+    def node(self, name: str) -> FakeNode:
+        """ Resolves a short name, a partial or a full DAG path; raises ValueError like Maya if not exactly one match. """
+        matches = self.nodes.get(name.rsplit("|", 1)[-1], ())
+        if name.startswith("|"):
+            matches = [node for node in matches if node.path == name]
+        elif "|" in name:
+            matches = [node for node in matches if node.path.endswith(f"|{name}")]
+        if not matches:
+            raise ValueError(f"No object matches name: {name}")
+        if len(matches) > 1:
+            raise ValueError(f"More than one object matches name: {name}")
+        return matches[0]
+
+    def plug(self, attribute_path: str) -> tuple:
+        """ Resolves 'node.attribute' to (node, attribute); transform attributes fall back to the shape's. """
+        name, attribute = attribute_path.split(".", 1)
+        node = self.node(name)
+        if attribute not in node.attributes and node.node_type == "transform" and node.children:
+            node = node.children[0]
+        if attribute not in node.attributes:
+            raise ValueError(f"No object matches name: {attribute_path}")
+        return node, attribute
+
+    # CALLBACKS --------------------------------------------
+    def add_callback(self, kind: str, target: object, function: object) -> int:
+        """ Registers an OpenMaya callback on a node (or a scene message); returns its id. """
+        callback_id = next(self.callback_ids)
+        self.callbacks[callback_id] = (kind, target, function)
+        self.watchers.setdefault((kind, target), {})[callback_id] = function
+        return callback_id
+
+    def remove_callback(self, callback_id: int):
+        """ Removes an OpenMaya callback; unknown ids are ignored. """
+        kind, target, _ = self.callbacks.pop(callback_id, (None, None, None))
+        watchers = self.watchers.get((kind, target))
+        if watchers is not None:
+            watchers.pop(callback_id, None)
+            if not watchers:
+                del self.watchers[(kind, target)]
+
+    def run_callbacks(self, kind: str, target: object, *args: object):
+        """ Runs the callbacks of a kind registered on a node (or a scene message), in O(1) of the others. """
+        for function in list(self.watchers.get((kind, target), {}).values()):
+            function(*args)
+
+    def notify(self, node: FakeNode, attribute: str):
+        """ Runs the attribute-changed callbacks and scriptJobs watching an attribute. """
+        self.run_callbacks("attribute", node, OpenMaya.MNodeMessage.kAttributeSet, MPlug(node, attribute), None, None)
+        for job_id in list(self.node_jobs.get(node, ())):
+            _, job_attribute, function = self.script_jobs[job_id]
+            if job_attribute == attribute:
+                function()
+
+    def remove_node(self, node: FakeNode):
+        for child in list(node.children):
+            self.remove_node(child)
+        self.run_callbacks("removed", node.node_type, MObject(node), None)
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        self.drop_node(node)
+        for kind in ("attribute", "name"):
+            for callback_id in list(self.watchers.get((kind, node), ())):
+                self.remove_callback(callback_id)
+        for job_id in self.node_jobs.pop(node, ()):
+            del self.script_jobs[job_id]
+
+    def new_scene(self):
+        """ Replaces the scene by an empty one, like File > New, running the scene callbacks around it. """
+        self.scene_message(MSceneMessage.kBeforeNew)
+        for node in [node for node in self.all_nodes() if node.parent is None]:
+            self.remove_node(node)
+        self.selection = []
+        self.scene_message(MSceneMessage.kAfterNew)
+
+    def scene_message(self, message: int):
+        self.run_callbacks("scene", message, None)
+
+    # cmds --------------------------------------------
+    def ls(self, *names, type=None, long=False, showType=False, selection=False, dagObjects=False, uuid=False):
+        if selection:
+            nodes = list(self.selection)
+            if dagObjects:
+                nodes = [child for node in nodes for child in [node] + node.children]
+        elif names:
+            nodes = []
+            for name in (names[0] if isinstance(names[0], (list, tuple)) else names):
+                try:
+                    nodes.append(self.node(name))
+                except ValueError:
+                    continue
+        else:
+            nodes = self.all_nodes()
+        if type is not None:
+            types_ = {type} if isinstance(type, str) else set(type)
+            nodes = [node for node in nodes if node.node_type in types_]
+        if uuid:
+            return [node.uuid for node in nodes]
+        result = []
+        for node in nodes:
+            result.append(node.path if long else node.name)
+            if showType:
+                result.append(node.node_type)
+        return result
+
+    def objExists(self, name: str) -> bool:
+        try:
+            if "." in name:
+                self.plug(name)
+            else:
+                self.node(name)
+        except ValueError:
+            return False
+        return True
+
+    def nodeType(self, name: str) -> str:
+        return self.node(name).node_type
+
+    def listRelatives(self, names, parent=False, shapes=False, fullPath=False, children=False):
+        nodes = [self.node(name) for name in ([names] if isinstance(names, str) else names)]
+        if parent:
+            found = [node.parent for node in nodes if node.parent is not None]
+        else:
+            found = [child for node in nodes for child in node.children]
+        found = list(dict.fromkeys(found))
+        if not found:
+            return None
+        return [node.path if fullPath else node.name for node in found]
+
+    def getAttr(self, attribute_path: str):
+        node, attribute = self.plug(attribute_path)
+        value = node.attributes[attribute]
+        return [value] if isinstance(value, tuple) else value
+
+    def setAttr(self, attribute_path: str, *values, type=None):
+        node, attribute = self.plug(attribute_path)
+        current = node.attributes[attribute]
+        if isinstance(current, tuple) or type == "double3":
+            value = tuple(float(value) for value in values)
+        elif type == "string":
+            value = str(values[0])
+        elif isinstance(current, bool):
+            value = bool(values[0])
+        elif isinstance(current, int):
+            value = int(values[0])
+        else:
+            value = float(values[0])
+        node.attributes[attribute] = value
+        self.notify(node, attribute)
+
+    def addAttr(self, name: str, longName: str, dataType: str = None, attributeType: str = None):
+        self.node(name).attributes[longName] = "" if dataType == "string" else 0.0
+
+    def createNode(self, node_type: str, name: str = None, skipSelect: bool = False) -> str:
+        node = FakeNode(self.unique_name(name or node_type), node_type)
+        self.add_node(node)
+        return node.name
+
+    def rename(self, old_name: str, new_name: str) -> str:
+        node = self.node(old_name)
+        if not new_name or not new_name.replace("_", "a").isalnum():
+            raise RuntimeError(f"New name has no legitimate characters: {new_name}")
+        self.set_name(node, new_name)
+        return node.name
+
+    def set_name(self, node: FakeNode, name: str):
+        """ Renames a node (suffixed if a sibling already has the name) and runs the name-changed callbacks. """
+        self.drop_node(node)
+        previous_name, node.name = node.name, self.unique_name(name, node.parent)
+        self.add_node(node)
+        if node.name != previous_name:
+            self.run_callbacks("name", node, MObject(node), previous_name, None)
+            self.run_callbacks("name", None, MObject(node), previous_name, None)  # NULL MObject: EVERY NODE
+
+    def parent(self, names, parent_name: str = None, world: bool = False) -> list:
+        new_parent = None if world else self.node(parent_name)
+        reparented = []
+        for node in [self.node(name) for name in ([names] if isinstance(names, str) else list(names))]:
+            if node.parent is not None:
+                node.parent.children.remove(node)
+            node.parent = new_parent
+            self.set_name(node, node.name)  # SUFFIXED IF A NEW SIBLING HAS THE SAME NAME
+            if new_parent is not None:
+                new_parent.children.append(node)
+            self.run_callbacks("dag", None, MDagMessage.kChildAdded, MDagPath(node), MDagPath(new_parent), None)
+            reparented.append(node.name)
+        return reparented
+
+    def delete(self, names):
+        for name in ([names] if isinstance(names, str) else list(names)):
+            try:
+                self.remove_node(self.node(name))
+            except ValueError:
+                continue
+        self.selection = [node for node in self.selection if self.exists(node)]
+
+    def select(self, names=None, clear=False, add=False):
+        if clear:
+            self.selection = []
+            return
+        names = [names] if isinstance(names, str) else list(names or [])
+        nodes = [self.node(name) for name in names]
+        self.selection = (self.selection if add else []) + nodes
+
+    def scriptJob(self, attributeChange=None, exists=None, kill=None, force=False):
+        if exists is not None:
+            return exists in self.script_jobs
+        if kill is not None:
+            job = self.script_jobs.pop(kill, None)
+            if job is not None:
+                self.node_jobs[job[0]].discard(kill)
+            return None
+        node, attribute = self.plug(attributeChange[0])
+        job_id = next(self.job_ids)
+        self.script_jobs[job_id] = (node, attribute, attributeChange[1])
+        self.node_jobs.setdefault(node, set()).add(job_id)
+        return job_id
+
+    def undoInfo(self, openChunk=False, closeChunk=False, chunkName=""):
+        if openChunk:
+            if self.undo_depth == 0:
+                self.undo_chunks.append(chunkName)
+            self.undo_depth += 1
+        elif closeChunk:
+            self.undo_depth -= 1
+
+    def evalDeferred(self, function, lowestPriority=False):
+        function()
+
+    def colorEditor(self, rgbValue=(1.0, 1.0, 1.0)):
+        return " ".join(f"{value}" for value in tuple(rgbValue) + (1.0,))
+
+    def light_command(self, light_type: str):
+        """ Returns a fake light creation command (cmds.spotLight, ...), which selects the new transform. """
+        def _create(name: str = None) -> str:
+            shape, transform = self.create_light(light_type, name)
+            self.selection = [self.node(transform)]
+            return shape.rsplit("|", 1)[-1]
+        return _create
+
+
+# OpenMaya --------------------------------------------
+class MObject:
+    def __init__(self, node: FakeNode = None):
+        self.node = node  # None FOR A NULL MObject
+
+    def hasFn(self, function_set: int) -> bool:
+        return function_set == MFn.kDagNode and self.node is not None and self.node.node_type != "network"
+
+
+class MFn:
+    kDagNode = 107
+
+
+class MPlug:
+    def __init__(self, node: FakeNode, attribute: str, index: int = None):
+        self.fake_node = node
+        self.attribute = attribute
+        self.index = index
+
+    @property
+    def value(self):
+        value = self.fake_node.attributes[self.attribute]
+        return value if self.index is None else value[self.index]
+
+    @property
+    def isChild(self) -> bool:
+        return self.index is not None
+
+    def parent(self) -> "MPlug":
+        return MPlug(self.fake_node, self.attribute)
+
+    def child(self, index: int) -> "MPlug":
+        return MPlug(self.fake_node, self.attribute, index)
+
+    def numChildren(self) -> int:
+        return len(self.value) if isinstance(self.value, tuple) else 0
+
+    def partialName(self, useLongNames: bool = False) -> str:
+        return self.attribute
+
+    def node(self) -> MObject:
+        return MObject(self.fake_node)
+
+    def asBool(self) -> bool:
+        return bool(self.value)
+
+    def asFloat(self) -> float:
+        return float(self.value)
+
+    def asInt(self) -> int:
+        return int(self.value)
+
+    def asString(self) -> str:
+        return str(self.value)
+
+
+class MSelectionList:
+    def __init__(self):
+        self.nodes = []
+        self.members = set()  # ID OF EVERY NODE HELD: DEDUPLICATES IN O(1), LIKE MAYA'S OWN LIST
+
+    def add(self, name: str):
+        try:
+            node = SCENE.node(name)
+        except ValueError:
+            raise RuntimeError(f"(kInvalidParameter): Object does not exist: {name}")
+        if id(node) not in self.members:
+            self.members.add(id(node))
+            self.nodes.append(node)
+
+    def clear(self):
+        self.nodes = []
+        self.members = set()
+
+    def length(self) -> int:
+        return len(self.nodes)
+
+    def getDependNode(self, index: int) -> MObject:
+        return MObject(self.nodes[index])
+
+
+class MFnDependencyNode:
+    def __init__(self, mobject: MObject):
+        self.fake_node = mobject.node
+
+    def findPlug(self, attribute: str, wantNetworkedPlug: bool) -> MPlug:
+        if attribute not in self.fake_node.attributes:
+            raise RuntimeError(f"(kInvalidParameter): No plug named {attribute}")
+        return MPlug(self.fake_node, attribute)
+
+    def uuid(self) -> "MUuid":
+        return MUuid(self.fake_node.uuid)
+
+    def name(self) -> str:
+        return self.fake_node.name
+
+    @property
+    def typeName(self) -> str:
+        return self.fake_node.node_type
+
+
+class MUuid:
+    def __init__(self, value: str):
+        self.value = value
+
+    def asString(self) -> str:
+        return self.value
+
+
+class MDagPath:
+    def __init__(self, node: FakeNode):
+        self.fake_node = node
+
+    @staticmethod
+    def getAPathTo(mobject: MObject) -> "MDagPath":
+        return MDagPath(mobject.node)
+
+    def fullPathName(self) -> str:
+        return self.fake_node.path
+
+
+class MItDag:
+    kDepthFirst = 0
+
+    def __init__(self, traversalType: int = 0, filterType: int = 0):
+        self.stack = []  # NODES LEFT TO VISIT, THE CURRENT ONE LAST
+
+    def reset(self, root: MDagPath, traversalType: int = 0, filterType: int = 0):
+        self.stack = [root.fake_node]
+
+    def isDone(self) -> bool:
+        return not self.stack
+
+    def currentItem(self) -> MObject:
+        return MObject(self.stack[-1])
+
+    def next(self):
+        self.stack.extend(reversed(self.stack.pop().children))
+
+
+class MObjectHandle:
+    def __init__(self, mobject: MObject):
+        self.fake_node = mobject.node
+
+    def object(self) -> MObject:
+        return MObject(self.fake_node)
+
+    def isValid(self) -> bool:
+        return SCENE.exists(self.fake_node)
+
+    def hashCode(self) -> int:
+        return id(self.fake_node)
+
+
+class MNodeMessage:
+    kAttributeSet = 1 << 3
+
+    @staticmethod
+    def addAttributeChangedCallback(mobject: MObject, function: object, clientData: object = None) -> int:
+        return SCENE.add_callback("attribute", mobject.node, function)
+
+    @staticmethod
+    def addNameChangedCallback(mobject: MObject, function: object, clientData: object = None) -> int:
+        return SCENE.add_callback("name", mobject.node, function)
+
+
+class MDGMessage:
+    @staticmethod
+    def addNodeAddedCallback(function: object, nodeType: str = "dependNode", clientData: object = None) -> int:
+        return SCENE.add_callback("added", nodeType, function)
+
+    @staticmethod
+    def addNodeRemovedCallback(function: object, nodeType: str = "dependNode", clientData: object = None) -> int:
+        return SCENE.add_callback("removed", nodeType, function)
+
+
+class MDagMessage:
+    kChildAdded = 2
+
+    @staticmethod
+    def addAllDagChangesCallback(function: object, clientData: object = None) -> int:
+        return SCENE.add_callback("dag", None, function)
+
+
+class MSceneMessage:
+    kAfterNew, kBeforeNew, kAfterOpen, kBeforeOpen = range(1, 5)
+
+    @staticmethod
+    def addCallback(message: int, function: object, clientData: object = None) -> int:
+        return SCENE.add_callback("scene", message, function)
+
+
+class MMessage:
+    @staticmethod
+    def removeCallback(callback_id: int):
+        SCENE.remove_callback(callback_id)
+
+    @staticmethod
+    def removeCallbacks(callback_ids: list):
+        for callback_id in callback_ids:
+            SCENE.remove_callback(callback_id)
+
+
+OpenMaya = types.ModuleType("maya.api.OpenMaya")
+for _member in (MObject, MFn, MPlug, MSelectionList, MFnDependencyNode, MObjectHandle, MUuid, MDagPath, MItDag,
+                MNodeMessage, MDGMessage, MDagMessage, MSceneMessage, MMessage):
+    setattr(OpenMaya, _member.__name__, _member)
+
+SCENE = FakeScene()
+
+
+def counted(name: str, function: object) -> object:
+    """ Wraps a fake command so that its calls are counted in `SCENE.calls`. """
+    def wrapper(*args, **kwargs):
+        SCENE.calls[name] = SCENE.calls.get(name, 0) + 1
+        return function(*args, **kwargs)
+    wrapper.__name__ = name
+    return wrapper
+
+
+def reset() -> FakeScene:
+    """ Empties the fake scene (nodes, selection, callbacks and counters) and returns it. """
+    SCENE.__init__()
+    return SCENE
+
+
+def install() -> FakeScene:
+    """
+    Registers the fake `maya`, `maya.cmds`, `maya.api.OpenMaya` and `mtoa.utils` modules.
+
+    Must run before the Light Manager modules are imported.
+
+    Returns:
+        FakeScene: The scene backing the fake modules.
+    """
+    cmds = types.ModuleType("maya.cmds")
+    for name in ("ls", "objExists", "nodeType", "listRelatives", "getAttr", "setAttr", "addAttr", "createNode",
+                 "rename", "parent", "delete", "select", "scriptJob", "undoInfo", "evalDeferred", "colorEditor"):
+        setattr(cmds, name, counted(name, lambda *args, _name=name, **kwargs: getattr(SCENE, _name)(*args, **kwargs)))
+    for light_type in ("spotLight", "pointLight", "directionalLight"):
+        setattr(cmds, light_type, counted(light_type, lambda *args, _type=light_type, **kwargs:
+                                          SCENE.light_command(_type)(*args, **kwargs)))
+    cmds.arnoldRenderView = lambda *args, **kwargs: None
+
+    utils = types.ModuleType("mtoa.utils")
+    utils.createLocator = lambda light_type, asLight=False: SCENE.create_light(light_type)
+
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+    api = types.ModuleType("maya.api")
+    api.OpenMaya = OpenMaya
+    maya.api = api
+    mtoa = types.ModuleType("mtoa")
+    mtoa.utils = utils
+    sys.modules.update({"maya": maya, "maya.cmds": cmds, "maya.api": api, "maya.api.OpenMaya": OpenMaya,
+                        "mtoa": mtoa, "mtoa.utils": utils})
+    return SCENE
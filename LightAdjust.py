@@ -0,0 +1,127 @@
+import numpy as np
+
+import maya.cmds as cmds
+
+from LightProfiler import CALLS
+from MayaLightScene import read_snapshot, undoable
+
+cmds = CALLS.proxy(cmds)  # COUNTS THE MAYA CALLS WHEN ENABLED
+
+
+def read_values(lights: list, attribute: str) -> tuple:
+    """
+    Reads one attribute of many lights into a NumPy array.
+
+    Lights whose node no longer exists or which lack the attribute are left out.
+
+    Args:
+        lights (list): The `LightRecord` of the lights to read.
+        attribute (str): The attribute to read (e.g., 'aiExposure').
+
+    Returns:
+        tuple: The lights actually read, and their values as an array (N, or N x 3 for colors).
+    """
+    snapshot = read_snapshot(lights, [attribute])
+    found = [(light, value) for light, value in zip(snapshot.lights, snapshot.columns[attribute]) if value is not None]
+    return [light for light, _ in found], np.array([value for _, value in found], dtype=float)
+
+
+def write_values(lights: list, attribute: str, values: np.ndarray) -> dict:
+    """
+    Writes computed values back to the lights, in one pass.
+
+    Args:
+        lights (list): The `LightRecord` of the lights to write.
+        attribute (str): The attribute to write.
+        values (np.ndarray): One value (or RGB row, for colors) per light.
+
+    Returns:
+        dict: The written values per light key (transform UUID), as Python scalars/tuples.
+    """
+    written = {}
+    for light, value in zip(lights, values.tolist()):
+        if isinstance(value, list):
+            cmds.setAttr(f"{light.shape}.{attribute}", *value, type="double3")
+            value = tuple(value)
+        else:
+            cmds.setAttr(f"{light.shape}.{attribute}", value)
+        written[light.uuid] = value
+    return written
+
+
+@undoable("Light Manager: Add Exposure")
+def add_exposure(lights: list, stops: float) -> dict:
+    """
+    Adds stops of exposure to many lights.
+
+    Args:
+        lights (list): The `LightRecord` of the lights to adjust.
+        stops (float): The stops to add (negative to darken).
+
+    Returns:
+        dict: The new 'aiExposure' per light key (transform UUID).
+    """
+    lights, exposures = read_values(lights, "aiExposure")
+    return write_values(lights, "aiExposure", exposures + stops)
+
+
+@undoable("Light Manager: Scale Samples")
+def scale_samples(lights: list, factor: float) -> dict:
+    """
+    Multiplies the samples of many lights, rounded to the nearest non-negative integer.
+
+    Args:
+        lights (list): The `LightRecord` of the lights to adjust.
+        factor (float): The scale factor.
+
+    Returns:
+        dict: The new 'aiSamples' per light key (transform UUID).
+    """
+    lights, samples = read_values(lights, "aiSamples")
+    return write_values(lights, "aiSamples", np.clip(np.rint(samples * factor), 0, None).astype(int))
+
+
+@undoable("Light Manager: Multiply Color")
+def multiply_color(lights: list, tint: object) -> dict:
+    """
+    Multiplies the color of many lights by a tint.
+
+    Args:
+        lights (list): The `LightRecord` of the lights to adjust.
+        tint (float or sequence): A scalar or an (r, g, b) multiplier.
+
+    Returns:
+        dict: The new 'color' per light key (transform UUID).
+    """
+    lights, colors = read_values(lights, "color")
+    if not lights:
+        return {}
+    return write_values(lights, "color", np.clip(colors * np.asarray(tint, dtype=float), 0.0, None))
+
+
+@undoable("Light Manager: Normalize Intensities")
+def normalize_intensities(lights: list, target: float = None) -> dict:
+    """
+    Sets the exposure of many lights so they all emit the same energy (intensity * 2^exposure).
+
+    Only the exposure is changed: each light gets `target - log2(intensity)`.
+    Lights with a null intensity are left untouched.
+
+    Args:
+        lights (list): The `LightRecord` of the lights to adjust.
+        target (float, optional): The energy to reach, in stops. Defaults to the mean of the lights.
+
+    Returns:
+        dict: The new 'aiExposure' per light key (transform UUID).
+    """
+    snapshot = read_snapshot(lights, ["intensity", "aiExposure"])
+    intensities = np.array([np.nan if value is None else value for value in snapshot.columns["intensity"]], dtype=float)
+    exposures = np.array([np.nan if value is None else value for value in snapshot.columns["aiExposure"]], dtype=float)
+    valid = (intensities > 0) & ~np.isnan(exposures)
+    if not valid.any():
+        return {}
+    base = np.log2(intensities[valid])
+    if target is None:
+        target = float(np.mean(base + exposures[valid]))
+    lights = [light for light, keep in zip(snapshot.lights, valid) if keep]
+    return write_values(lights, "aiExposure", target - base)
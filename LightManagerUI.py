@@ -1,16 +1,55 @@
-from Qt.QtCore import Qt, QSize, Signal
-from Qt.QtGui import QFont, QWheelEvent
-from Qt.QtWidgets import (QWidget, QTableWidget, QComboBox, QLabel, QLineEdit, QPushButton,
-                          QVBoxLayout, QHBoxLayout, QAbstractItemView, QGroupBox, QApplication, QMessageBox)
+import os
+
+from Qt.QtCore import (Qt, QSize, QRect, QPoint, QTimer, QEvent, Signal, QAbstractTableModel, QModelIndex,
+                       QItemSelectionModel)
+from Qt.QtGui import QFont, QWheelEvent, QColor, QPixmap, QPalette
+from Qt.QtWidgets import (QWidget, QTableView, QComboBox, QLabel, QLineEdit, QPushButton, QStyledItemDelegate,
+                          QVBoxLayout, QHBoxLayout, QAbstractItemView, QGroupBox, QApplication, QMessageBox,
+                          QDialog, QCheckBox, QPlainTextEdit, QFileDialog, QProgressBar)
+
+from LightProfiler import PROFILER
 
 
 TABLE_HEADER = ["Name", "M", "S", "Light",
                 "Color", "Exposure", "Samples", "AOV"]
+# LIGHT ATTRIBUTE DISPLAYED IN EACH COLUMN
+TABLE_COLUMNS = ["name", "visibility", "solo", "node_type",
+                 "color", "aiExposure", "aiSamples", "aiAov"]
+CHECKABLE_COLUMNS = ("visibility", "solo")
+EDITABLE_COLUMNS = ("aiExposure", "aiSamples", "aiAov")
+RAW_ROLE = Qt.UserRole  # RETURNS THE UNFORMATTED VALUE OF A CELL
+ICON_ROLE = Qt.UserRole + 1  # RETURNS THE PIXMAP OF THE LIGHT TYPE
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "img", "icons")
+ICON_FILES = {
+    "aiPhotometricLight": "PhotometricLightShelf.png",
+    "aiSkyDomeLight": "SkydomeLightShelf.png",
+    "aiAreaLight": "AreaLightShelf.png",
+    "spotLight": "spotLight.png",
+    "pointLight": "pointLight.png",
+    "directionalLight": "directionalLight.png",
+}
+FALLBACK_ICON = "pointLight.png"  # USED FOR ANY UNKNOWN LIGHT TYPE
+ICON_CACHE = {}  # FILE NAME -> SHARED PIXMAP, FILLED ON FIRST USE
 HEADER_SIZE = [160, 20, 20, 40, 55, 75, 75, 60]
 FONT = "Nimbus Sans, Bold"
 COLOR = "#c7c7c5"
 FONT_WEIGHT = 600
 FONT_SIZE = 11
+# LIGHT TABLE STYLE: SET ONCE THROUGH THE TABLE PALETTE, CELLS ARE PAINTED BY THE DELEGATE
+TABLE_BACKGROUND = QColor("#222b33")
+TABLE_TEXT = QColor("white")
+MUTED_COLOR = QColor("#f94144")
+SOLO_COLOR = QColor("#adb5bd")
+SWATCH_SIZE = QSize(40, 20)
+# RELATIVE ADJUSTMENTS OF THE SELECTED LIGHTS: LABEL -> OPERATION
+ADJUST_OPERATIONS = {
+    "Exposure + stops": "exposure",
+    "Samples x factor": "samples",
+    "Color x tint": "color",
+    "Normalize exposure": "normalize",
+}
+SEARCH_DELAY_MS = 150  # DEBOUNCE DELAY BETWEEN THE LAST KEYSTROKE AND THE SEARCH
 
 
 class LightManagerUI(QWidget):
@@ -33,11 +72,17 @@ class LightManagerUI(QWidget):
     """
 
     signal_light_created = Signal(str, str, object)  # (light_name, light_type, table_widget)
-    signal_light_renamed = Signal(str, str, object)  # (old_name, new_name,table_widget)
+    signal_light_edited = Signal(str, str, object, object)  # (light_key, attribute, value, table_widget)
+    signal_light_color = Signal(str, object)  # (light_key, table_widget)
+    signal_light_adjusted = Signal(str, str, object)  # (operation, value, table_widget)
+    signal_light_renamed = Signal(str, str, object)  # (light_key, new_name, table_widget)
     signal_light_search = Signal(str, object)  # (search_text, table_widget)
     signal_table_selection = Signal(object)  # (table_widget)
     signal_light_deleted = Signal(object)  # (table_widget)
-    signal_refresh = Signal(object)  # (table_widget)
+    signal_refresh = Signal(object, bool)  # (table_widget, full)
+    signal_closed = Signal(object)  # (table_widget)
+    signal_batch_rename_preview = Signal(str, str, bool, object)  # (pattern, replacement, regex, table_widget)
+    signal_batch_rename = Signal(str, str, bool, object)  # (pattern, replacement, regex, table_widget)
 
     LIGHT_TYPES = [
         "aiPhotometricLight",
@@ -75,6 +120,10 @@ class LightManagerUI(QWidget):
         self.info_text = self.label_text("Light Manager initialized")
         self.info_text.setFont(QFont(FONT, 9))
 
+        self.progress_populate = QProgressBar()  # SHOWN WHILE A BIG SCENE IS LISTED PROGRESSIVELY
+        self.progress_populate.setFormat("Listing lights... %v / %m")
+        self.progress_populate.hide()
+
         title_ligh_search = self.label_text("Search by name:")
         self.entry_ligh_search = self.bar_text("Type light name to search", 570)
 
@@ -87,6 +136,10 @@ class LightManagerUI(QWidget):
 
         self.button_refresh = self.push_button("Refresh")
         self.button_refresh.setStyleSheet(" background-color: #8ecae6 ; color: black;")
+        self.button_refresh.setToolTip("Shift+click to rescan the whole scene.")
+
+        self.button_stats = self.push_button("Stats")
+        self.button_stats.setFixedWidth(70)
 
         self.button_render = self.push_button(" Render ")
         self.button_render.setFixedSize(70, 30)
@@ -98,21 +151,37 @@ class LightManagerUI(QWidget):
         self.button_rename = self.push_button("Rename Light")
         self.button_rename.setStyleSheet(" background-color: #D17D98 ; color: white;")
 
+        self.button_batch_rename = self.push_button("Batch Rename")
+        self.button_batch_rename.setStyleSheet(" background-color: #D17D98 ; color: white;")
+
         self.button_delete = self.push_button("Delete")
         self.button_delete.setStyleSheet(" background-color: #c1121f ; color: white;")
 
-        self.light_table = QTableWidget()
-        # SELECT ONLY ONE ROW AT A TIME
-        self.light_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        title_adjust = self.label_text("Adjust selected:")
+        self.combo_adjust = QComboBox()
+        self.combo_adjust.addItems(list(ADJUST_OPERATIONS))
+        self.combo_adjust.setFont(QFont(FONT, FONT_SIZE))
+        self.entry_adjust = self.bar_text("Value (e.g. 1 or 1 0.8 0.6)", 200)
+        self.button_adjust = self.push_button("Apply")
+
+        # MODEL/VIEW TABLE: ROWS ARE PLAIN DATA PAINTED BY THE DELEGATE, ONLY VISIBLE ROWS COST ANYTHING
+        self.light_model = LightTableModel()
+        self.light_table = LightTableView()
+        self.light_table.setModel(self.light_model)
+        self.light_table.setItemDelegate(LightItemDelegate(self.light_table))
+        # SELECT SEVERAL ROWS (CTRL/SHIFT) TO EDIT THEIR LIGHTS AT ONCE
+        self.light_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.light_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.light_table.setEditTriggers(
-            QAbstractItemView.NoEditTriggers)  # MAKE CELLS NON-EDITABLE
-        self.light_table.setStyleSheet("QTableWidget { background-color: #222b33 ; color: white; }")
-
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked | QAbstractItemView.EditKeyPressed)
+        palette = self.light_table.palette()
+        palette.setColor(QPalette.Base, TABLE_BACKGROUND)
+        palette.setColor(QPalette.Text, TABLE_TEXT)
+        self.light_table.setPalette(palette)
+        self.light_table.verticalHeader().setDefaultSectionSize(30)
+
+        header = self.light_table.horizontalHeader()
         for y in range(len(TABLE_HEADER)):
-            self.light_table.setColumnCount(y+1)
-            self.light_table.setHorizontalHeaderLabels(
-                TABLE_HEADER)  # SET THE HEADER LABELS
-            header = self.light_table.horizontalHeader()
             header.resizeSection(y, HEADER_SIZE[y])
 
         group_box_01 = QGroupBox()
@@ -126,6 +195,8 @@ class LightManagerUI(QWidget):
         layoutV_01_01 = QVBoxLayout()
         layoutH_02 = QHBoxLayout()
         layoutH_03 = QHBoxLayout()
+        layoutH_04 = QHBoxLayout()
+        layoutH_05 = QHBoxLayout()
 
         layoutV_01_01.addWidget(self.button_render)
         layoutH_02.addWidget(title_light_name)
@@ -134,10 +205,18 @@ class LightManagerUI(QWidget):
         layoutH_02.addWidget(self.combo_light_type)
         layoutH_03.addWidget(self.button_create_light)
         layoutH_03.addWidget(self.button_rename)
+        layoutH_03.addWidget(self.button_batch_rename)
         layoutV_02.addWidget(title_ligh_search)
         layoutV_02.addWidget(self.entry_ligh_search)
         layoutV_02.addWidget(self.light_table)
-        layoutV_02.addWidget(self.button_refresh)
+        layoutH_04.addWidget(title_adjust)
+        layoutH_04.addWidget(self.combo_adjust)
+        layoutH_04.addWidget(self.entry_adjust)
+        layoutH_04.addWidget(self.button_adjust)
+        layoutV_02.addLayout(layoutH_04)
+        layoutH_05.addWidget(self.button_refresh)
+        layoutH_05.addWidget(self.button_stats)
+        layoutV_02.addLayout(layoutH_05)
         layoutV_02.addWidget(self.button_delete)
 
         layoutV_01.addLayout(layoutV_01_01)
@@ -151,6 +230,7 @@ class LightManagerUI(QWidget):
         self.main_layout.addWidget(self.logo)
         self.main_layout.addWidget(group_box_01)
         self.main_layout.addWidget(group_box_02)
+        self.main_layout.addWidget(self.progress_populate)
         self.main_layout.addWidget(self.info_text)
 
         self.main_layout.setAlignment(Qt.AlignCenter)
@@ -208,8 +288,48 @@ class LightManagerUI(QWidget):
         self.button_rename.clicked.connect(self.emit_light_renamed)
         self.button_refresh.clicked.connect(self.emit_refresh)
         self.button_delete.clicked.connect(self.emit_light_deleted)
-        self.light_table.itemSelectionChanged.connect(self.emit_table_selection)
-        self.entry_ligh_search.textChanged.connect(self.emit_light_search)
+        self.button_adjust.clicked.connect(self.emit_light_adjusted)
+        self.button_stats.clicked.connect(self.show_stats)
+        self.button_batch_rename.clicked.connect(self.show_batch_rename)
+        self.light_table.selectionModel().selectionChanged.connect(self.emit_table_selection)
+        self.light_table.clicked.connect(self.emit_light_color)
+        self.light_model.signal_light_edited.connect(self.emit_light_edited)
+        # DEBOUNCE THE SEARCH: EVERY KEYSTROKE RESTARTS THE TIMER, ONLY THE LAST QUERY IS EMITTED
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.emit_light_search)
+        self.entry_ligh_search.textChanged.connect(self.schedule_light_search)
+
+    def show_stats(self):
+        """ Opens the timing statistics window. """
+        if getattr(self, "stats_dialog", None) is None:
+            self.stats_dialog = StatsDialog(self)
+        self.stats_dialog.update_stats()
+        self.stats_dialog.show()
+        self.stats_dialog.raise_()
+
+    def show_batch_rename(self):
+        """ Opens the batch rename window for the lights selected in the table. """
+        if getattr(self, "batch_rename_dialog", None) is None:
+            self.batch_rename_dialog = BatchRenameDialog(self)
+            self.batch_rename_dialog.changed.connect(self.emit_batch_rename_preview)
+            self.batch_rename_dialog.button_apply.clicked.connect(self.emit_batch_rename)
+            self.light_table.selectionModel().selectionChanged.connect(self.emit_batch_rename_preview)
+        self.batch_rename_dialog.show()
+        self.batch_rename_dialog.raise_()
+        self.emit_batch_rename_preview()
+
+    def set_rename_preview(self, renames: list):
+        """ Shows the (light key, current name, new name) of a planned batch rename, or an error message. """
+        if getattr(self, "batch_rename_dialog", None) is not None:
+            self.batch_rename_dialog.set_preview(renames)
+
+    def closeEvent(self, event: QEvent):
+        """ Lets the logic release its Maya callbacks when the window is closed. """
+        self.search_timer.stop()
+        self.signal_closed.emit(self.light_table)
+        super().closeEvent(event)
 
     # EMITTERS --------------------------------------
     def emit_light_created(self):
@@ -228,20 +348,37 @@ class LightManagerUI(QWidget):
         from the input field, then emits the `signal_light_renamed`.
         Clears the light name field.
         """
-        if self.light_table.selectedItems():
-            self.old_name = self.light_table.currentItem().text()
+        if self.light_table.selectionModel().hasSelection():
+            self.old_name = self.light_model.light_key(self.light_table.currentIndex().row())
             self.new_name = self.entry_light_name.text()
             self.signal_light_renamed.emit(
                 self.old_name, self.new_name, self.light_table)
             self.entry_light_name.clear()
 
+    def emit_batch_rename_preview(self, *args: object):
+        """ Emits the `signal_batch_rename_preview` with the rename entered in the batch rename window. """
+        dialog = getattr(self, "batch_rename_dialog", None)
+        if dialog is not None and dialog.isVisible():
+            self.signal_batch_rename_preview.emit(*dialog.rename(), self.light_table)
+
+    def emit_batch_rename(self):
+        """ Emits the `signal_batch_rename` with the rename entered in the batch rename window. """
+        self.signal_batch_rename.emit(*self.batch_rename_dialog.rename(), self.light_table)
+        self.emit_batch_rename_preview()
+
     def emit_light_deleted(self):
         """
         Confirms with the user and then emits the `signal_light_deleted`
         for the currently selected light.
         """
-        if self.light_table.selectedItems():
-            selection = self.light_table.currentItem().text()
+        # FROM THE SELECTION RANGES, AS `MayaLightLogic.selected_lights` DOES: `selectedRows` QUERIES EVERY CELL
+        selected_rows = {row for selected in self.light_table.selectionModel().selection()
+                         for row in range(selected.top(), selected.bottom() + 1)}
+        if selected_rows:
+            if len(selected_rows) == 1:
+                selection = self.light_model.light_name(next(iter(selected_rows)))
+            else:
+                selection = f"these {len(selected_rows)} lights"
             btn_question = QMessageBox.question(
                 self, "Question", f"Are you sure you want to delete {selection} ?")
             if btn_question == QMessageBox.Yes:
@@ -249,6 +386,30 @@ class LightManagerUI(QWidget):
             else:
                 pass
 
+    def set_search_delay(self, delay_ms: int):
+        """ Sets the debounce delay of the search field, in milliseconds (0 searches on every keystroke). """
+        self.search_timer.setInterval(delay_ms)
+
+    def set_progress(self, done: int, total: int):
+        """ Shows the progress of the progressive listing of the lights; hidden once `done` reaches `total`. """
+        if done >= total:
+            self.progress_populate.hide()
+            return
+        self.progress_populate.setRange(0, total)
+        self.progress_populate.setValue(done)
+        self.progress_populate.show()
+
+    def schedule_light_search(self, *args: str):
+        """ (Re)starts the search debounce timer, cancelling any search not emitted yet. """
+        self.search_timer.start()
+
+    def emit_light_adjusted(self):
+        """
+        Gathers the adjustment and its value from the UI and emits the `signal_light_adjusted`.
+        """
+        operation = ADJUST_OPERATIONS[self.combo_adjust.currentText()]
+        self.signal_light_adjusted.emit(operation, self.entry_adjust.text(), self.light_table)
+
     def emit_light_search(self):
         """
         Gathers the search text from the input field and emits the
@@ -257,13 +418,133 @@ class LightManagerUI(QWidget):
         search_text = self.entry_ligh_search.text()
         self.signal_light_search.emit(search_text, self.light_table)
 
-    def emit_table_selection(self):
+    def emit_table_selection(self, *args: object):
         """ Emits the `signal_table_selection` when the table selection changes. """
         self.signal_table_selection.emit(self.light_table)
 
+    def emit_light_edited(self, light_key: str, attribute: str, value: object):
+        """ Forwards an edit made in the table model as the `signal_light_edited`. """
+        self.signal_light_edited.emit(light_key, attribute, value, self.light_table)
+
+    def emit_light_color(self, index: QModelIndex):
+        """ Emits the `signal_light_color` when a cell of the 'Color' column is clicked. """
+        if TABLE_COLUMNS[index.column()] == "color":
+            self.signal_light_color.emit(self.light_model.light_key(index.row()), self.light_table)
+
     def emit_refresh(self):
-        """ Emits the `signal_refresh. """
-        self.signal_refresh.emit(self.light_table)
+        """ Emits the `signal_refresh`; Shift+click asks for a full rescan of the scene. """
+        self.signal_refresh.emit(self.light_table, QApplication.keyboardModifiers() == Qt.ShiftModifier)
+
+
+class StatsDialog(QDialog):
+    """
+    Shows the operation timings recorded by the profiler (see `LightProfiler`).
+
+    Recording is opt-in: it is toggled from the 'Record timings' checkbox.
+    The records can be exported as JSON or CSV.
+    """
+
+    def __init__(self, parent: QWidget = None):
+        """ Builds the window. """
+        super().__init__(parent)
+        self.setWindowTitle("Light Manager Stats")
+        self.setMinimumSize(560, 320)
+
+        self.checkbox_record = QCheckBox("Record timings")
+        self.checkbox_record.setChecked(PROFILER.enabled)
+        self.checkbox_record.toggled.connect(PROFILER.enable)
+        self.stats_text = QPlainTextEdit()
+        self.stats_text.setReadOnly(True)
+        self.stats_text.setFont(QFont("Courier", 9))
+        button_update = QPushButton("Update")
+        button_clear = QPushButton("Clear")
+        button_export = QPushButton("Export...")
+        button_update.clicked.connect(self.update_stats)
+        button_clear.clicked.connect(self.clear_stats)
+        button_export.clicked.connect(self.export_stats)
+
+        layout_buttons = QHBoxLayout()
+        layout_buttons.addWidget(self.checkbox_record)
+        layout_buttons.addStretch()
+        layout_buttons.addWidget(button_update)
+        layout_buttons.addWidget(button_clear)
+        layout_buttons.addWidget(button_export)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.stats_text)
+        layout.addLayout(layout_buttons)
+
+    def update_stats(self):
+        """ Displays the summary of the recorded timings. """
+        lines = [f"{'Operation':<46}{'Count':>7}{'Mean ms':>10}{'Max ms':>10}{'Last ms':>10}"]
+        for name, entry in sorted(PROFILER.summary().items()):
+            lines.append(f"{name:<46}{entry['count']:>7}{entry['mean_ms']:>10.2f}"
+                         f"{entry['max_ms']:>10.2f}{entry['last_ms']:>10.2f}")
+        self.stats_text.setPlainText("\n".join(lines))
+
+    def clear_stats(self):
+        """ Drops the recorded timings. """
+        PROFILER.clear()
+        self.update_stats()
+
+    def export_stats(self):
+        """ Asks for a file and writes the recorded timings to it (CSV for .csv files, JSON otherwise). """
+        path, _ = QFileDialog.getSaveFileName(self, "Export timings", "light_manager_stats.json",
+                                              "JSON (*.json);;CSV (*.csv)")
+        if path:
+            PROFILER.export(path)
+
+
+class BatchRenameDialog(QDialog):
+    """
+    Renames the selected lights at once, by replacing a text or a regular expression in their names.
+
+    A result ending with '#' in the naming convention (e.g. 'LGT_RIM_###')
+    gets the next free counters of its base. The renames are previewed as the
+    fields are typed, and applied in one undo step.
+    """
+
+    changed = Signal()
+
+    def __init__(self, parent: QWidget = None):
+        """ Builds the window. """
+        super().__init__(parent)
+        self.setWindowTitle("Light Manager Batch Rename")
+        self.setMinimumSize(480, 320)
+
+        self.entry_pattern = QLineEdit(placeholderText="Find (e.g. KEY, or ^LGT_(.*)_\\d+$)")
+        self.entry_replacement = QLineEdit(placeholderText="Replace with (e.g. RIM, or LGT_\\1_###)")
+        self.checkbox_regex = QCheckBox("Regular expression")
+        self.preview_text = QPlainTextEdit()
+        self.preview_text.setReadOnly(True)
+        self.preview_text.setFont(QFont("Courier", 9))
+        self.button_apply = QPushButton("Rename")
+        self.entry_pattern.textChanged.connect(self.changed)
+        self.entry_replacement.textChanged.connect(self.changed)
+        self.checkbox_regex.toggled.connect(self.changed)
+
+        layout_buttons = QHBoxLayout()
+        layout_buttons.addWidget(self.checkbox_regex)
+        layout_buttons.addStretch()
+        layout_buttons.addWidget(self.button_apply)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.entry_pattern)
+        layout.addWidget(self.entry_replacement)
+        layout.addWidget(self.preview_text)
+        layout.addLayout(layout_buttons)
+
+    def rename(self) -> tuple:
+        """ Returns the (pattern, replacement, regex) entered. """
+        return self.entry_pattern.text(), self.entry_replacement.text(), self.checkbox_regex.isChecked()
+
+    def set_preview(self, renames: object):
+        """ Lists the planned (light key, current name, new name) renames, or shows an error message. """
+        if isinstance(renames, str):
+            self.preview_text.setPlainText(renames)
+            self.button_apply.setEnabled(False)
+            return
+        lines = [f"{name}  ->  {new_name}" for _, name, new_name in renames]
+        self.preview_text.setPlainText("\n".join(lines) or "No light to rename.")
+        self.button_apply.setEnabled(bool(renames))
 
 
 class CustomLineEditNum(QLineEdit):
@@ -272,9 +553,9 @@ class CustomLineEditNum(QLineEdit):
     It supports different step sizes based on keyboard modifiers (Ctrl, Shift).
     """
 
-    def __init__(self,):
+    def __init__(self, parent: QWidget = None):
         """Initializes the QLineEdit and sets the default text."""
-        super().__init__()
+        super().__init__(parent)
         self.setText("0.000")
 
     def wheelEvent(self, event: QWheelEvent):
@@ -298,3 +579,259 @@ class CustomLineEditNum(QLineEdit):
         delta = event.angleDelta().y() / 120
         new_value = current_value + delta * step
         self.setText(f"{new_value:.3f}")
+
+
+def light_icon(light_type: str) -> QPixmap:
+    """
+    Returns the pixmap shared by every row of a light type.
+
+    Each icon file is read from disk once per session, on first use; unknown
+    types get the fallback icon.
+
+    Args:
+        light_type (str): The node type of the light (e.g., 'spotLight').
+    """
+    file_name = ICON_FILES.get(light_type, FALLBACK_ICON)
+    pixmap = ICON_CACHE.get(file_name)
+    if pixmap is None:
+        pixmap = ICON_CACHE[file_name] = QPixmap(os.path.join(ICON_DIR, file_name))
+    return pixmap
+
+
+def is_checked(state: object) -> bool:
+    """ Returns True for a checked Qt.CheckState, whether the binding passes it as an enum or an int. """
+    return getattr(state, "value", state) == getattr(Qt.Checked, "value", Qt.Checked)
+
+
+def format_value(value: object) -> str:
+    """ Formats an attribute value for display: floats with 3 decimals, anything else as is. """
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return "" if value is None else f"{value}"
+
+
+class LightTableModel(QAbstractTableModel):
+    """
+    Table model holding one row of plain data per light.
+
+    Each row is a dict keyed by `TABLE_COLUMNS` plus a 'key' (the UUID of the
+    light's transform, used by the logic layer to address the row) and an 'icon'.
+    No widget is created per row: the view only asks for the cells it paints.
+
+    Edits made in the view are not written to Maya here; they are emitted
+    through `signal_light_edited` for the logic layer to apply.
+    """
+
+    signal_light_edited = Signal(str, str, object)  # (light_key, attribute, value)
+
+    def __init__(self, parent: QWidget = None):
+        """ Initializes an empty model. """
+        super().__init__(parent)
+        self.lights = []  # ONE DICT PER ROW
+        self.light_rows = {}  # LIGHT KEY -> ROW
+
+    # QAbstractTableModel INTERFACE --------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.lights)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(TABLE_COLUMNS)
+
+    def headerData(self, section: int, orientation: object, role: int = Qt.DisplayRole) -> object:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return TABLE_HEADER[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> object:
+        flags = super().flags(index)
+        if not index.isValid():
+            return flags
+        attribute = TABLE_COLUMNS[index.column()]
+        if attribute in CHECKABLE_COLUMNS:
+            flags |= Qt.ItemIsUserCheckable
+        elif attribute in EDITABLE_COLUMNS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+        light = self.lights[index.row()]
+        attribute = TABLE_COLUMNS[index.column()]
+        value = light.get(attribute)
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if attribute == "name" or attribute in EDITABLE_COLUMNS:
+                return format_value(value)
+        elif role == Qt.CheckStateRole:
+            if attribute in CHECKABLE_COLUMNS:
+                return Qt.Checked if value else Qt.Unchecked
+        elif role == Qt.BackgroundRole:
+            # MUTED LIGHTS IN RED, SOLOED LIGHT IN GREY
+            if attribute == "visibility" and not value:
+                return MUTED_COLOR
+            if attribute == "solo" and value:
+                return SOLO_COLOR
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        elif role == RAW_ROLE:
+            return value
+        elif role == ICON_ROLE:
+            return light.get("icon")
+        return None
+
+    def setData(self, index: QModelIndex, value: object, role: int = Qt.EditRole) -> bool:
+        if not index.isValid():
+            return False
+        light = self.lights[index.row()]
+        attribute = TABLE_COLUMNS[index.column()]
+
+        if role == Qt.CheckStateRole and attribute in CHECKABLE_COLUMNS:
+            # CHECK STATES ARE UI STATE: STORE THEM RIGHT AWAY
+            value = is_checked(value)
+            light[attribute] = value
+            self.dataChanged.emit(index, index)
+        elif role != Qt.EditRole or attribute not in EDITABLE_COLUMNS:
+            return False
+        self.signal_light_edited.emit(light["key"], attribute, value)
+        return True
+
+    # LIGHT ROWS --------------------------------------
+    def light_key(self, row: int) -> str:
+        """ Returns the key of the light displayed at a row. """
+        return self.lights[row]["key"]
+
+    def light_name(self, row: int) -> str:
+        """ Returns the display name of the light at a row. """
+        return self.lights[row]["name"]
+
+    def light_row(self, light_key: str) -> int:
+        """ Returns the row of a light, or -1 if it is not in the model. """
+        return self.light_rows.get(light_key, -1)
+
+    def add_lights(self, lights: list):
+        """
+        Appends rows at the end of the model in a single insertion.
+
+        Args:
+            lights (list): One dict of values per light, including its 'key'.
+        """
+        if not lights:
+            return
+        first = len(self.lights)
+        self.beginInsertRows(QModelIndex(), first, first + len(lights) - 1)
+        for row, light in enumerate(lights, first):
+            self.lights.append(light)
+            self.light_rows[light["key"]] = row
+        self.endInsertRows()
+
+    def remove_lights(self, light_keys: list):
+        """
+        Removes the rows of the given lights; unknown keys are ignored.
+
+        Args:
+            light_keys (list): The keys of the lights to remove.
+        """
+        rows = sorted((self.light_rows[key] for key in light_keys if key in self.light_rows), reverse=True)
+        if not rows:
+            return
+        for row in rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.light_rows[self.lights.pop(row)["key"]]
+            self.endRemoveRows()
+        # ONLY THE ROWS BELOW THE FIRST REMOVED ONE HAVE SHIFTED
+        for row in range(rows[-1], len(self.lights)):
+            self.light_rows[self.lights[row]["key"]] = row
+
+    def clear_lights(self):
+        """ Removes every row at once. """
+        self.beginResetModel()
+        self.lights = []
+        self.light_rows = {}
+        self.endResetModel()
+
+    def update_light(self, light_key: str, values: dict):
+        """
+        Updates some values of a light and repaints its row.
+
+        Args:
+            light_key (str): The key of the light to update.
+            values (dict): The new values, keyed by attribute.
+        """
+        row = self.light_rows.get(light_key)
+        if row is None:
+            return
+        self.lights[row].update(values)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(TABLE_COLUMNS) - 1))
+
+    def update_lights(self, values: dict):
+        """
+        Updates several lights at once and repaints the rows they span with a single signal.
+
+        Args:
+            values (dict): The new values per light key, each keyed by attribute.
+        """
+        rows = [self.light_rows[key] for key in values if key in self.light_rows]
+        if not rows:
+            return
+        for row in rows:
+            self.lights[row].update(values[self.lights[row]["key"]])
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(TABLE_COLUMNS) - 1))
+
+
+class LightTableView(QTableView):
+    """
+    Table view of the lights.
+
+    Clicking an editable or checkable cell of a row that is already part of a
+    multi-row selection keeps the selection, so that the edit can be applied
+    to every selected light.
+    """
+
+    def selectionCommand(self, index: QModelIndex, event: QEvent = None) -> object:
+        if (event is not None and event.type() == QEvent.MouseButtonRelease and index.isValid()
+                and TABLE_COLUMNS[index.column()] not in ("name", "node_type")
+                and self.selectionModel().isRowSelected(index.row(), QModelIndex())):
+            return QItemSelectionModel.NoUpdate
+        return super().selectionCommand(index, event)
+
+
+class LightItemDelegate(QStyledItemDelegate):
+    """
+    Paints and edits the cells of the light table.
+
+    The 'Light' column is painted with the type icon and the 'Color' column
+    with a swatch; 'Exposure' and 'Samples' are edited with a
+    `CustomLineEditNum` (wheel adjustments) and 'AOV' with a plain line edit.
+    Every other cell uses the default painting (text and check boxes).
+    """
+
+    def paint(self, painter: object, option: object, index: QModelIndex):
+        super().paint(painter, option, index)
+        attribute = TABLE_COLUMNS[index.column()]
+        if attribute == "node_type":
+            pixmap = index.data(ICON_ROLE)
+            if pixmap is not None and not pixmap.isNull():
+                rect = QRect(0, 0, min(pixmap.width(), option.rect.width()), min(pixmap.height(), option.rect.height()))
+                rect.moveCenter(option.rect.center())
+                painter.drawPixmap(rect, pixmap)
+        elif attribute == "color":
+            color = index.data(RAW_ROLE)
+            if color:
+                rect = QRect(QPoint(0, 0), SWATCH_SIZE)
+                rect.moveCenter(option.rect.center())
+                painter.fillRect(rect, QColor.fromRgbF(*[min(max(c, 0.0), 1.0) for c in color]))
+
+    def createEditor(self, parent: QWidget, option: object, index: QModelIndex) -> QLineEdit:
+        if TABLE_COLUMNS[index.column()] == "aiAov":
+            editor = QLineEdit(parent)
+        else:
+            editor = CustomLineEditNum(parent)
+        editor.setAlignment(Qt.AlignCenter)
+        return editor
+
+    def setEditorData(self, editor: QLineEdit, index: QModelIndex):
+        editor.setText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor: QLineEdit, model: LightTableModel, index: QModelIndex):
+        model.setData(index, editor.text(), Qt.EditRole)
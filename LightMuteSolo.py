@@ -0,0 +1,142 @@
+import json
+
+import maya.cmds as cmds
+
+from LightProfiler import CALLS
+
+cmds = CALLS.proxy(cmds)  # COUNTS THE MAYA CALLS WHEN ENABLED
+
+STATE_NODE = "lightManager_muteSolo"  # network NODE STORING THE STATE IN THE SCENE
+STATE_ATTRIBUTE = "muteSoloState"  # JSON STRING: {"muted": [light keys], "soloed": light key or null}
+
+
+def read_state() -> dict:
+    """ Reads the Mute/Solo state stored in the scene, in a single Maya call ({} if there is none). """
+    try:
+        data = cmds.getAttr(f"{STATE_NODE}.{STATE_ATTRIBUTE}")
+    except ValueError:  # NO STATE NODE IN THIS SCENE
+        return {}
+    try:
+        return json.loads(data or "{}")
+    except ValueError:
+        return {}
+
+
+def write_state(data: dict):
+    """ Stores the Mute/Solo state in the scene, in a single Maya call once the node exists. """
+    if not cmds.objExists(STATE_NODE):
+        cmds.createNode("network", name=STATE_NODE, skipSelect=True)
+        cmds.addAttr(STATE_NODE, longName=STATE_ATTRIBUTE, dataType="string")
+    cmds.setAttr(f"{STATE_NODE}.{STATE_ATTRIBUTE}", json.dumps(data), type="string")
+
+
+class MuteSoloState:
+    """
+    The Mute/Solo state of the listed lights, held as plain data.
+
+    Each light has an 'enabled' flag (its 'M' checkbox: checked means not
+    muted) and at most one light is soloed. The visibility each light should
+    have follows from these, and is compared with the visibility last applied
+    to Maya so that only the lights whose visibility actually changes have to
+    be written.
+
+    The state can be saved to and restored from the scene (`to_data`,
+    `restore`), so that the mute flags hidden by a solo are not lost.
+    """
+
+    def __init__(self):
+        """ Initializes an empty state. """
+        self.enabled = {}  # LIGHT KEY -> 'M' CHECKBOX STATE
+        self.applied = {}  # LIGHT KEY -> VISIBILITY LAST APPLIED TO (OR READ FROM) MAYA
+        self.soloed = None  # KEY OF THE SOLOED LIGHT, IF ANY
+        self.stored_muted = set()  # LIGHTS MUTED IN THE RESTORED STATE
+
+    def restore(self, data: dict):
+        """
+        Restores a state saved by `to_data`; it applies to the lights added afterwards.
+
+        Args:
+            data (dict): The saved state.
+        """
+        self.stored_muted = set(data.get("muted", ()))
+        self.soloed = data.get("soloed")
+
+    def to_data(self) -> dict:
+        """
+        Returns the state in a JSON serializable form.
+
+        The restored mute flags of the lights not listed yet (e.g. during a
+        progressive listing) are kept, so saving never drops them.
+        """
+        muted = {key for key, enabled in self.enabled.items() if not enabled}
+        return {"muted": sorted(muted | (self.stored_muted - self.enabled.keys())), "soloed": self.soloed}
+
+    def add(self, light_key: str, visible: bool):
+        """
+        Starts tracking a light from its current visibility in Maya.
+
+        With a restored state, the light's 'M' state comes from the stored mute
+        flags: while a light is soloed, the other lights are hidden by the solo,
+        not muted.
+
+        Args:
+            light_key (str): The key of the light.
+            visible (bool): The light's current visibility.
+        """
+        if light_key in self.stored_muted:
+            self.enabled[light_key] = False
+        elif self.soloed is not None and light_key != self.soloed:
+            self.enabled[light_key] = True
+        else:
+            self.enabled[light_key] = visible
+        self.applied[light_key] = visible
+
+    def remove(self, light_key: str):
+        """ Stops tracking a light; unknown keys are ignored. """
+        self.enabled.pop(light_key, None)
+        self.applied.pop(light_key, None)
+        if self.soloed == light_key:
+            self.soloed = None
+
+    def set_enabled(self, light_key: str, enabled: bool):
+        """ Sets the 'M' checkbox state of a light; unmuting it also drops its restored mute flag. """
+        if light_key in self.enabled:
+            self.enabled[light_key] = enabled
+            if enabled:
+                self.stored_muted.discard(light_key)
+
+    def set_solo(self, light_key: str, state: bool) -> str:
+        """
+        Solos or un-solos a light; soloing a light un-solos the previous one.
+
+        Args:
+            light_key (str): The key of the light.
+            state (bool): True to solo the light.
+
+        Returns:
+            str: The key of the light that lost its solo, or None.
+        """
+        previous = self.soloed
+        if state:
+            self.soloed = light_key
+            return previous if previous != light_key else None
+        if previous == light_key:
+            self.soloed = None
+        return None
+
+    def target(self, light_key: str) -> bool:
+        """ Returns the visibility a light should have. """
+        # A RESTORED SOLO ONLY APPLIES IF ITS LIGHT IS STILL LISTED
+        if self.soloed in self.enabled:
+            return light_key == self.soloed
+        return self.enabled[light_key]
+
+    def changes(self) -> dict:
+        """ Returns {light_key: visibility} for the lights whose target visibility differs from the applied one. """
+        return {light_key: visible for light_key, visible in
+                ((light_key, self.target(light_key)) for light_key in self.enabled)
+                if visible != self.applied[light_key]}
+
+    def mark_applied(self, visibilities: dict):
+        """ Records visibilities written to, or read back from, Maya. """
+        self.applied.update(visibilities)
@@ -0,0 +1,99 @@
+import re
+
+NAME_PREFIX = "LGT_"
+# LGT_<BASE>_<COUNTER>, e.g. LGT_KEY_003
+CONVENTION = re.compile(r"^LGT_(?P<base>.+)_(?P<counter>\d+)$")
+# '#' RUN IN A BATCH RENAME RESULT, REPLACED BY THE NEXT COUNTER OF ITS BASE (e.g. 'LGT_RIM_###')
+COUNTER_PLACEHOLDER = re.compile(r"^LGT_(?P<base>.+)_(?P<digits>#+)$")
+
+
+def format_name(base: str, counter: int, digits: int = 3) -> str:
+    """ Returns the conventional name LGT_<BASE>_<COUNTER>, the counter padded to `digits`. """
+    return f"{NAME_PREFIX}{base}_{counter:0{digits}d}"
+
+
+class NameAllocator:
+    """
+    Hands out the names of the naming convention (LGT_<BASE>_###).
+
+    Existing names are indexed as the lights are listed (`add`): only the
+    highest counter of each base is kept, so the next name of a base is
+    allocated in O(1) without asking Maya, and without relying on Maya's
+    auto-suffixing on collision (LGT_KEY_000 -> LGT_KEY_001 instead of
+    LGT_KEY_0001). Counters are never reused once handed out.
+    """
+
+    def __init__(self):
+        """ Initializes an empty allocator. """
+        self.highest = {}  # BASE -> HIGHEST COUNTER IN USE
+
+    def __len__(self) -> int:
+        return len(self.highest)
+
+    def add(self, name: str):
+        """ Indexes an existing name; names outside the convention are ignored. """
+        match = CONVENTION.match(name)
+        if match is None:
+            return
+        base, counter = match.group("base"), int(match.group("counter"))
+        if counter > self.highest.get(base, -1):
+            self.highest[base] = counter
+
+    def allocate(self, base: str, digits: int = 3) -> str:
+        """
+        Reserves and returns the next free name of a base.
+
+        Args:
+            base (str): The base name (e.g., 'KEY' for LGT_KEY_###).
+            digits (int, optional): The padding of the counter. Defaults to 3.
+
+        Returns:
+            str: The conventional name (e.g., 'LGT_KEY_004').
+        """
+        counter = self.highest.get(base, -1) + 1
+        self.highest[base] = counter
+        return format_name(base, counter, digits)
+
+    def plan(self, names: dict, pattern: str, replacement: str, regex: bool = False) -> list:
+        """
+        Computes a batch rename without applying it, nor reserving any name.
+
+        Every name has `pattern` replaced by `replacement` (as a regular
+        expression if `regex` is set). A result ending with a run of '#' in
+        the convention (e.g. 'LGT_RIM_###') gets the next counters of its base.
+        A result already in the convention whose counter may be in use (not
+        above the highest one of its base, planned names included) gets the
+        next counter of its base instead, so the batch never collides with
+        the existing names, nor with itself.
+
+        Args:
+            names (dict): The current name per light key, in the order to rename them.
+            pattern (str): The text, or regular expression, to replace.
+            replacement (str): The replacement text (may use regex groups, e.g. '\\1').
+            regex (bool, optional): True if `pattern` is a regular expression. Defaults to False.
+
+        Returns:
+            list: (light key, current name, new name) for every name that changes.
+
+        Raises:
+            re.error: If `pattern` or `replacement` is not a valid regular expression.
+        """
+        highest = dict(self.highest)
+        compiled = re.compile(pattern) if regex else None
+        renames = []
+        for light_key, name in names.items():
+            new_name = compiled.sub(replacement, name) if regex else name.replace(pattern, replacement)
+            match = COUNTER_PLACEHOLDER.match(new_name) or CONVENTION.match(new_name)
+            if match is not None and new_name != name:
+                base = match.group("base")
+                if "digits" in match.groupdict():
+                    highest[base] = highest.get(base, -1) + 1
+                    new_name = format_name(base, highest[base], len(match.group("digits")))
+                elif int(match.group("counter")) <= highest.get(base, -1):  # MAY BE TAKEN: NEXT FREE COUNTER
+                    highest[base] += 1
+                    new_name = format_name(base, highest[base], len(match.group("counter")))
+                else:
+                    highest[base] = int(match.group("counter"))
+            if new_name and new_name != name:
+                renames.append((light_key, name, new_name))
+        return renames
@@ -0,0 +1,223 @@
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import NamedTuple
+import csv
+import io
+import json
+import os
+import time
+
+
+class TimingRecord(NamedTuple):
+    """
+    The duration of one operation, or of one phase of an operation.
+
+    Attributes:
+        timestamp (float): When the operation ended (seconds since the epoch).
+        name (str): The operation, with its enclosing operations (e.g., 'refresh/scene query').
+        duration_ms (float): The duration in milliseconds.
+    """
+    timestamp: float
+    name: str
+    duration_ms: float
+
+
+class Profiler:
+    """
+    Opt-in timing of the Light Manager operations.
+
+    Operations are wrapped with `profiled` and their sub-phases with `measure`;
+    while the profiler is enabled, each one records its duration in a ring
+    buffer holding the last `size` records. Disabled (the default, unless the
+    MLM_PROFILE environment variable is set), it only costs a flag check.
+    """
+
+    def __init__(self, size: int = 5000):
+        """
+        Initializes an empty profiler.
+
+        Args:
+            size (int, optional): The number of records kept. Defaults to 5000.
+        """
+        self.enabled = bool(os.getenv("MLM_PROFILE"))
+        self.records = deque(maxlen=size)
+        self.stack = []  # NAMES OF THE OPERATIONS IN PROGRESS
+
+    def enable(self, enabled: bool = True):
+        """ Starts (or stops) recording. """
+        self.enabled = enabled
+
+    def clear(self):
+        """ Drops every record. """
+        self.records.clear()
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        Records the duration of the block, nested under the operations in progress.
+
+        Args:
+            name (str): The name of the operation or phase.
+        """
+        if not self.enabled:
+            yield
+            return
+        self.stack.append(name)
+        path = "/".join(self.stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.stack.pop()
+            self.records.append(TimingRecord(time.time(), path, duration_ms))
+
+    def profiled(self, name: str = None):
+        """
+        Decorator recording the duration of every call of a function, and the Maya calls it makes (see `CallCounter`).
+
+        Args:
+            name (str, optional): The name to record. Defaults to the function name.
+        """
+        def decorator(func: object) -> object:
+            @wraps(func)
+            def wrapper(*args: object, **kwargs: object) -> object:
+                with self.measure(name or func.__name__), CALLS.operation(name or func.__name__):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def summary(self) -> dict:
+        """ Returns {name: {'count', 'total_ms', 'mean_ms', 'max_ms', 'last_ms'}} over the recorded durations. """
+        stats = {}
+        for record in self.records:
+            entry = stats.setdefault(record.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += record.duration_ms
+            entry["max_ms"] = max(entry["max_ms"], record.duration_ms)
+            entry["last_ms"] = record.duration_ms
+        for entry in stats.values():
+            entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        return stats
+
+    def to_json(self) -> str:
+        """ Returns the records and their summary as JSON. """
+        return json.dumps({"records": [record._asdict() for record in self.records], "summary": self.summary()},
+                          indent=2)
+
+    def to_csv(self) -> str:
+        """ Returns the records as CSV (timestamp, name, duration_ms). """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(TimingRecord._fields)
+        writer.writerows(self.records)
+        return buffer.getvalue()
+
+    def export(self, path: str):
+        """ Writes the records to a .csv file, or to a JSON file for any other extension. """
+        with open(path, "w", newline="") as handle:
+            handle.write(self.to_csv() if path.lower().endswith(".csv") else self.to_json())
+
+
+class CallCounter:
+    """
+    Opt-in accounting of the calls made into Maya, per command and per operation.
+
+    Modules wrap their `cmds` module with `proxy`; while the counter is enabled
+    (MLM_COUNT_CALLS environment variable, or `enable`), every command called
+    through the proxy is counted under the outermost operation in progress
+    (see `Profiler.profiled`), or under '<none>' outside any operation.
+    Disabled, the proxy hands out the real commands.
+    """
+
+    def __init__(self):
+        """ Initializes an empty counter. """
+        self.enabled = bool(os.getenv("MLM_COUNT_CALLS"))
+        self.counts = {}  # OPERATION -> {COMMAND: NUMBER OF CALLS}
+        self.operations = []  # OPERATIONS IN PROGRESS
+
+    def enable(self, enabled: bool = True):
+        """ Starts (or stops) counting. """
+        self.enabled = enabled
+
+    def reset(self):
+        """ Drops every count. """
+        self.counts.clear()
+
+    @contextmanager
+    def operation(self, name: str):
+        """ Counts the calls made in the block under `name`, unless an operation is already in progress. """
+        self.operations.append(name)
+        try:
+            yield
+        finally:
+            self.operations.pop()
+
+    def record(self, command: str):
+        """ Counts one call of a command. """
+        operation = self.operations[0] if self.operations else "<none>"
+        commands = self.counts.setdefault(operation, {})
+        commands[command] = commands.get(command, 0) + 1
+
+    def calls(self, operation: str) -> dict:
+        """ Returns {command: number of calls} made by an operation since the last reset. """
+        return dict(self.counts.get(operation, {}))
+
+    def over_budget(self, operation: str, budgets: dict = None) -> dict:
+        """
+        Returns the commands an operation called more often than its budget allows.
+
+        Args:
+            operation (str): The operation to check.
+            budgets (dict, optional): {operation: {command: max calls}}. Defaults to `CALL_BUDGETS`.
+
+        Returns:
+            dict: {command: (calls, budget)} for every command over budget.
+        """
+        budget = (CALL_BUDGETS if budgets is None else budgets).get(operation, {})
+        calls = self.calls(operation)
+        return {command: (calls.get(command, 0), limit) for command, limit in budget.items()
+                if calls.get(command, 0) > limit}
+
+    def proxy(self, module: object) -> "CountingProxy":
+        """ Returns a stand-in for `module` whose calls are counted. """
+        return CountingProxy(module, self)
+
+
+class CountingProxy:
+    """ Stand-in for a command module (e.g. maya.cmds) counting the commands called through it. """
+
+    def __init__(self, module: object, counter: CallCounter):
+        self._module = module
+        self._counter = counter
+
+    def __getattr__(self, name: str) -> object:
+        command = getattr(self._module, name)
+        if not self._counter.enabled or not callable(command):
+            return command
+
+        def _counted(*args: object, **kwargs: object) -> object:
+            self._counter.record(name)
+            return command(*args, **kwargs)
+        return _counted
+
+
+# MAYA CALLS ALLOWED PER OPERATION, WHATEVER THE NUMBER OF LIGHTS IN THE SCENE.
+# PER-LIGHT WRITES (setAttr, ...) ARE NOT BUDGETED: ONLY THE QUERIES THAT MUST STAY CONSTANT.
+CALL_BUDGETS = {
+    "refresh": {"ls": 1, "listRelatives": 0, "nodeType": 0, "getAttr": 0, "objExists": 0, "select": 1},
+    "populate_rows": {"ls": 0, "listRelatives": 0, "nodeType": 0, "getAttr": 0},
+    "search_light": {"ls": 0, "getAttr": 0, "objExists": 0, "select": 0},
+    "update_all_lights_visibility": {"ls": 0, "getAttr": 0, "objExists": 1},
+    "create_light": {"ls": 2, "listRelatives": 1, "nodeType": 0, "getAttr": 0},
+    "rename_light": {"ls": 0, "listRelatives": 0, "nodeType": 0, "getAttr": 0, "rename": 1, "select": 0},
+    "batch_rename": {"ls": 0, "listRelatives": 0, "nodeType": 0, "getAttr": 0},
+    "delete": {"ls": 1, "listRelatives": 0, "nodeType": 0, "getAttr": 0},
+    "adjust_lights": {"ls": 0, "listRelatives": 0, "nodeType": 0, "getAttr": 0, "objExists": 0},
+}
+
+PROFILER = Profiler()  # SHARED BY THE WHOLE MANAGER
+CALLS = CallCounter()
+profiled = PROFILER.profiled
+measure = PROFILER.measure
@@ -0,0 +1,98 @@
+from collections import defaultdict
+
+
+def trigrams(name: str) -> set:
+    """ Returns the set of 3-character substrings of a name. """
+    return {name[i:i + 3] for i in range(len(name) - 2)}
+
+
+def is_subsequence(query: str, name: str) -> bool:
+    """ Returns True if the characters of `query` appear in `name` in the same order. """
+    remaining = iter(name)
+    return all(char in remaining for char in query)
+
+
+class LightNameIndex:
+    """
+    Incremental index of light names for substring and fuzzy search.
+
+    Names are stored lower-case and indexed by trigram and by character, so a
+    query only verifies the names sharing all of its trigrams (or characters,
+    for queries shorter than 3) instead of scanning every light. Lights are
+    added, renamed and removed one at a time, at a cost proportional to the
+    length of their name.
+    """
+
+    def __init__(self):
+        """ Initializes an empty index. """
+        self.names = {}  # LIGHT KEY -> LOWER-CASE NAME
+        self.grams = defaultdict(set)  # TRIGRAM -> LIGHT KEYS
+        self.chars = defaultdict(set)  # CHARACTER -> LIGHT KEYS
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, light_key: str, name: str):
+        """
+        Indexes the name of a light, replacing its previous name if any.
+
+        Args:
+            light_key (str): The key of the light.
+            name (str): The name to search the light by.
+        """
+        if light_key in self.names:
+            self.remove(light_key)
+        name = name.lower()
+        self.names[light_key] = name
+        for gram in trigrams(name):
+            self.grams[gram].add(light_key)
+        for char in set(name):
+            self.chars[char].add(light_key)
+
+    def rename(self, light_key: str, name: str):
+        """ Re-indexes a light under its new name. """
+        self.add(light_key, name)
+
+    def remove(self, light_key: str):
+        """ Drops a light from the index; unknown keys are ignored. """
+        name = self.names.pop(light_key, None)
+        if name is None:
+            return
+        for table, tokens in ((self.grams, trigrams(name)), (self.chars, set(name))):
+            for token in tokens:
+                keys = table[token]
+                keys.discard(light_key)
+                if not keys:
+                    del table[token]
+
+    def candidates(self, table: dict, tokens: set) -> set:
+        """ Returns the keys found under every token, starting from the rarest one. """
+        buckets = sorted((table.get(token, set()) for token in tokens), key=len)
+        if not buckets:
+            return set(self.names)
+        return buckets[0].intersection(*buckets[1:])
+
+    def search(self, query: str, fuzzy: bool = False, within: set = None) -> set:
+        """
+        Returns the keys of the lights whose name matches a query (case insensitive).
+
+        Args:
+            query (str): The text to look for. An empty query matches every light.
+            fuzzy (bool, optional): If True, match names containing the query's characters
+                in order (e.g. 'lkey' matches 'LGT_KEY_000') instead of as a substring. Defaults to False.
+            within (set, optional): Only consider these keys, e.g. the matches of a shorter query
+                this one extends. Defaults to every indexed light.
+        """
+        query = query.lower()
+        if not query:
+            return set(self.names) if within is None else within & self.names.keys()
+        if within is not None:
+            # NARROWING: VERIFYING THE PREVIOUS MATCHES IS CHEAPER THAN INTERSECTING THE INDEX
+            keys = within & self.names.keys()
+        elif fuzzy or len(query) < 3:
+            keys = self.candidates(self.chars, set(query))
+        else:
+            keys = self.candidates(self.grams, trigrams(query))
+        if fuzzy:
+            return {key for key in keys if is_subsequence(query, self.names[key])}
+        return {key for key in keys if query in self.names[key]}
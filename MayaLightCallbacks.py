@@ -0,0 +1,296 @@
+from Qt.QtCore import QObject, QTimer
+
+import maya.api.OpenMaya as om
+
+
+class LightCallbackHub:
+    """
+    Single entry point for the attribute changes of the lights listed in the manager.
+
+    One lightweight OpenMaya attribute-changed callback is registered per light
+    shape (instead of one scriptJob per light and per attribute), plus a single
+    name-changed and a single DAG-changed callback for the whole scene, so N
+    lights cost N + 2 callbacks. With `on_visibility`, the light transforms
+    are watched too (2N + 2 callbacks), for their visibility only: its new
+    value is handed over right away, so the visibility last set in Maya (by
+    the manager, an undo or the Outliner) is known without reading it back.
+    Every callback goes through
+    `attribute_changed`, `name_changed` or `dag_changed`, which resolve the
+    light from the node handle. Renames of a light's transform or shape,
+    including the ones made in the Outliner, are reported as a change of the
+    'name' attribute; a reparenting or the rename of another DAG node (e.g. a
+    parent group) is reported as a hierarchy change of the watched lights
+    below that node, if there are any. Only the subtree of the node is walked,
+    so creating or renaming nodes elsewhere costs nothing per light.
+    """
+
+    def __init__(self, attributes: list, on_change: object, on_hierarchy_change: object = None,
+                 on_visibility: object = None):
+        """
+        Initializes a hub with no watched light.
+
+        Args:
+            attributes (list): The attribute long names to report (e.g., 'aiExposure').
+            on_change (callable): Called with (light_key, attribute) for every reported change,
+                with 'name' as the attribute when the transform or the shape of the light is renamed.
+            on_hierarchy_change (callable, optional): Called with the keys of the lights whose DAG paths
+                may have changed (reparented, or below a renamed or reparented DAG node).
+            on_visibility (callable, optional): Called with (light_key, visible) when the visibility of the
+                transform of a light is set.
+        """
+        self.attributes = set(attributes)
+        self.on_change = on_change
+        self.on_hierarchy_change = on_hierarchy_change
+        self.on_visibility = on_visibility
+        self.callbacks = {}  # LIGHT KEY -> ATTRIBUTE-CHANGED CALLBACK IDS (SHAPE, AND TRANSFORM WITH `on_visibility`)
+        self.scene_callbacks = []  # NAME AND DAG-CHANGED CALLBACK IDS OF THE WHOLE SCENE, WHILE A LIGHT IS WATCHED
+        self.nodes = {}  # NODE HANDLE HASH -> LIGHT KEY
+        self.transforms = {}  # TRANSFORM HANDLE HASH -> LIGHT KEY, WHOSE VISIBILITY IS REPORTED
+        self.handles = {}  # LIGHT KEY -> NODE HANDLE HASHES
+
+    def __len__(self) -> int:
+        return len(self.callbacks)
+
+    def watch(self, light_key: str, shape: str, transform: str):
+        """
+        Starts reporting the changes of a light; a light already watched is left as is.
+
+        Args:
+            light_key (str): The key the changes are reported with.
+            shape (str): The light's shape, whose attributes are reported.
+            transform (str): The light's transform.
+        """
+        if light_key in self.callbacks:
+            return
+        selection = om.MSelectionList()
+        selection.add(shape)
+        selection.add(transform)
+        shape_node, transform_node = selection.getDependNode(0), selection.getDependNode(1)
+        if not self.scene_callbacks:
+            # A NULL MObject WATCHES THE RENAMES OF EVERY NODE, FILTERED THROUGH `self.nodes`
+            self.scene_callbacks = [om.MNodeMessage.addNameChangedCallback(om.MObject(), self.name_changed),
+                                    om.MDagMessage.addAllDagChangesCallback(self.dag_changed)]
+        watched = (shape_node, transform_node) if self.on_visibility is not None else (shape_node,)
+        self.callbacks[light_key] = [om.MNodeMessage.addAttributeChangedCallback(node, self.attribute_changed)
+                                     for node in watched]
+        self.handles[light_key] = handles = tuple(om.MObjectHandle(node).hashCode()
+                                                  for node in (shape_node, transform_node))
+        for handle in handles:
+            self.nodes[handle] = light_key
+        self.transforms[handles[1]] = light_key
+
+    def unwatch(self, light_key: str):
+        """ Stops reporting the changes of a light; unknown keys are ignored. """
+        callback_ids = self.callbacks.pop(light_key, None)
+        if callback_ids is None:
+            return
+        om.MMessage.removeCallbacks(callback_ids)
+        for handle in self.handles.pop(light_key):
+            self.nodes.pop(handle, None)
+            self.transforms.pop(handle, None)
+
+    def clear(self):
+        """ Removes every callback registered by the hub. """
+        callback_ids = [callback_id for ids in self.callbacks.values() for callback_id in ids] + self.scene_callbacks
+        if callback_ids:
+            om.MMessage.removeCallbacks(callback_ids)
+        self.callbacks.clear()
+        self.scene_callbacks = []
+        self.nodes.clear()
+        self.transforms.clear()
+        self.handles.clear()
+
+    def attribute_changed(self, message: int, plug: om.MPlug, other_plug: om.MPlug, *client_data: object):
+        """ OpenMaya callback shared by every watched node. """
+        if not message & om.MNodeMessage.kAttributeSet:
+            return
+        # REPORT A CHILD PLUG (e.g. colorR) AS ITS COMPOUND PARENT (color)
+        if plug.isChild:
+            plug = plug.parent()
+        attribute = plug.partialName(useLongNames=True)
+        if attribute == "visibility":
+            light_key = self.transforms.get(om.MObjectHandle(plug.node()).hashCode())  # NOT THE SHAPE'S
+            if light_key is not None and self.on_visibility is not None:
+                self.on_visibility(light_key, plug.asBool())
+            return
+        if attribute not in self.attributes:
+            return
+        light_key = self.nodes.get(om.MObjectHandle(plug.node()).hashCode())
+        if light_key is not None:
+            self.on_change(light_key, attribute)
+
+    def name_changed(self, node: om.MObject, previous_name: str, *client_data: object):
+        """ OpenMaya callback of every rename in the scene: reports the ones of a watched light as a 'name' change. """
+        light_key = self.nodes.get(om.MObjectHandle(node).hashCode())
+        if light_key is not None:
+            self.on_change(light_key, "name")
+        elif node.hasFn(om.MFn.kDagNode):
+            try:
+                path = om.MDagPath.getAPathTo(node)
+            except RuntimeError:  # NOT IN THE DAG (YET)
+                return
+            self.hierarchy_changed(path)  # e.g. A PARENT GROUP: THE PATHS BELOW IT CHANGED
+
+    def dag_changed(self, message: int, child: om.MDagPath, parent: om.MDagPath, *client_data: object):
+        """ OpenMaya callback of every parenting change in the scene: reports the lights moved with the child. """
+        self.hierarchy_changed(child)
+
+    def hierarchy_changed(self, path: om.MDagPath):
+        """
+        Reports a hierarchy change of the watched lights at or below a DAG node, if there are any.
+
+        Args:
+            path (MDagPath): The renamed or reparented node.
+        """
+        if self.on_hierarchy_change is None:
+            return
+        light_keys = set()
+        iterator = om.MItDag()
+        try:
+            iterator.reset(path)
+        except RuntimeError:  # INVALID PATH (e.g. THE NODE IS BEING DELETED)
+            return
+        while not iterator.isDone():
+            light_key = self.nodes.get(om.MObjectHandle(iterator.currentItem()).hashCode())
+            if light_key is not None:
+                light_keys.add(light_key)
+            iterator.next()
+        if light_keys:
+            self.on_hierarchy_change(light_keys)
+
+
+def watch_scene_changes(on_close: object, on_open: object) -> list:
+    """
+    Registers callbacks around the replacement of the current scene (File > New, File > Open).
+
+    Args:
+        on_close (callable): Called before the current scene is closed.
+        on_open (callable): Called once the new scene is loaded.
+
+    Returns:
+        list: The callback ids, to release with `unwatch_scene_changes`.
+    """
+    message = om.MSceneMessage
+    return [message.addCallback(message.kBeforeNew, on_close),
+            message.addCallback(message.kBeforeOpen, on_close),
+            message.addCallback(message.kAfterNew, on_open),
+            message.addCallback(message.kAfterOpen, on_open)]
+
+
+def unwatch_scene_changes(callback_ids: list):
+    """ Removes the callbacks registered by `watch_scene_changes`. """
+    if callback_ids:
+        om.MMessage.removeCallbacks(list(callback_ids))
+
+
+class LightSceneTracker:
+    """
+    Collects the light shapes created and deleted in the scene between two refreshes.
+
+    One node-added and one node-removed callback is registered per light type
+    (not per light), so a refresh only has to look at the lights that changed
+    instead of listing the whole scene again. The nodes are only recorded by
+    handle: they are resolved when the changes are taken.
+    """
+
+    def __init__(self):
+        """ Initializes a tracker that is not tracking yet. """
+        self.callbacks = []  # NODE ADDED/REMOVED CALLBACK IDS, WHILE TRACKING
+        self.added = {}  # NODE HANDLE HASH -> HANDLE OF THE LIGHT SHAPES CREATED
+        self.removed = set()  # NODE HANDLE HASHES OF THE LIGHT SHAPES DELETED
+
+    @property
+    def tracking(self) -> bool:
+        """ True if every change since the last `start` was recorded. """
+        return bool(self.callbacks)
+
+    def start(self, light_types: object):
+        """
+        Starts (or restarts) recording, from a state where every light is known (e.g. after a full scan).
+
+        Args:
+            light_types (iterable): The light node types to track.
+        """
+        self.stop()
+        message = om.MDGMessage
+        for light_type in light_types:
+            self.callbacks.append(message.addNodeAddedCallback(self.node_added, light_type))
+            self.callbacks.append(message.addNodeRemovedCallback(self.node_removed, light_type))
+
+    def stop(self):
+        """ Removes the callbacks and forgets the recorded changes. """
+        if self.callbacks:
+            om.MMessage.removeCallbacks(self.callbacks)
+        self.callbacks = []
+        self.added.clear()
+        self.removed.clear()
+
+    def take(self) -> tuple:
+        """
+        Returns the changes recorded since the last call, and forgets them.
+
+        Returns:
+            tuple: The handles of the light shapes created, and the handle hashes of the ones deleted.
+                A node deleted then restored (e.g. by an undo) is reported in both.
+        """
+        added, removed = list(self.added.values()), set(self.removed)
+        self.added.clear()
+        self.removed.clear()
+        return added, removed
+
+    def node_added(self, node: om.MObject, *client_data: object):
+        """ OpenMaya callback of every light shape created (or restored by an undo). """
+        handle = om.MObjectHandle(node)
+        self.added[handle.hashCode()] = handle
+
+    def node_removed(self, node: om.MObject, *client_data: object):
+        """ OpenMaya callback of every light shape deleted. """
+        handle = om.MObjectHandle(node).hashCode()
+        self.added.pop(handle, None)
+        self.removed.add(handle)
+
+
+class UpdateQueue(QObject):
+    """
+    Coalesces change notifications and flushes them at most once per UI tick.
+
+    Notifications only mark a (light, attribute) pair as dirty. The first one
+    starts a single-shot timer; when it fires, every dirty pair gathered in the
+    meantime is handed over in one batch. A script editing 1,000 lights thus
+    triggers one flush once it returns control to the event loop, not 1,000
+    immediate UI updates.
+    """
+
+    def __init__(self, on_flush: object, interval_ms: int = 33, parent: QObject = None):
+        """
+        Initializes an empty queue.
+
+        Args:
+            on_flush (callable): Called with a {light_key: {attribute, ...}} dict of the dirty values.
+            interval_ms (int, optional): The delay between the first notification and the flush. Defaults to 33 (~30 Hz).
+            parent (QObject, optional): The Qt parent of the queue.
+        """
+        super().__init__(parent)
+        self.on_flush = on_flush
+        self.dirty = {}  # LIGHT KEY -> SET OF CHANGED ATTRIBUTES
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def push(self, light_key: str, attribute: str):
+        """ Marks an attribute of a light as dirty and schedules a flush. """
+        self.dirty.setdefault(light_key, set()).add(attribute)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def discard(self, light_key: str):
+        """ Drops the pending changes of a light (e.g. when its row is removed). """
+        self.dirty.pop(light_key, None)
+
+    def flush(self):
+        """ Hands every dirty value over in one batch. """
+        self.timer.stop()
+        dirty, self.dirty = self.dirty, {}
+        if dirty:
+            self.on_flush(dirty)
@@ -1,16 +1,45 @@
 from functools import partial
 import os
+import re
+import time
 
-from Qt.QtWidgets import QWidget, QTableWidgetItem, QPushButton, QHBoxLayout, QCheckBox, QLineEdit, QLabel
-from Qt.QtCore import Qt, QTimer, QObject
-from Qt.QtGui import QPixmap
+from Qt.QtCore import QTimer, QObject
 
-import mtoa.utils as au
 import maya.cmds as cmds
 
-from LightManagerUI import CustomLineEditNum
+from LightManagerUI import light_icon
+from LightProfiler import CALLS, measure, profiled
+from LightMuteSolo import MuteSoloState, read_state, write_state
+from LightNaming import NameAllocator
+from LightSearchIndex import LightNameIndex
+from MayaLightCallbacks import (LightCallbackHub, LightSceneTracker, UpdateQueue, unwatch_scene_changes,
+                                watch_scene_changes)
+from MayaLightScene import (LightRecord, LightRegistry, identify_lights, read_lights, read_snapshot, scan_lights,
+                            undo_chunk, undoable)
 
-SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
+cmds = CALLS.proxy(cmds)  # COUNTS THE MAYA CALLS WHEN ENABLED
+
+SEARCH_CHUNK_SIZE = 500  # ROWS SHOWN/HIDDEN PER EVENT LOOP ITERATION BY A SEARCH PASS
+POPULATE_CHUNK_SIZE = 250  # ROWS ADDED PER EVENT LOOP ITERATION WHEN LISTING A BIG SCENE
+RENAME_REPORT_LIMIT = 5  # NAMES CHANGED BY MAYA LISTED IN THE MESSAGE OF A BATCH RENAME
+
+
+def call_soon(function: object, context: object):
+    """
+    Runs a function on the next event loop iteration, unless `context` is deleted first.
+
+    Unlike an unparented `QTimer.singleShot`, the pending call is dropped with
+    the widget it works on, so a closed window is not kept alive until it runs.
+
+    Args:
+        function (callable): The function to run.
+        context (QObject): The object the call belongs to (e.g., the light table).
+    """
+    timer = QTimer(context)
+    timer.setSingleShot(True)
+    timer.timeout.connect(function)
+    timer.timeout.connect(timer.deleteLater)
+    timer.start(0)
 
 
 class MayaLightLogic(QObject):
@@ -24,7 +53,29 @@ class MayaLightLogic(QObject):
         super().__init__()
         self.ui = ui
         self.maya_path = os.environ.get('MAYA_LOCATION')
-        self.script_jobs = []  # JOB ID COLLECTOR
+        # ATTRIBUTE AND NAME CHANGES OF EVERY LIGHT, COALESCED AND FLUSHED TO THE TABLE ~30 TIMES PER SECOND
+        self.updates = UpdateQueue(self.flush_updates, parent=self)
+        self.scene_lights = LightRegistry()  # TRANSFORM UUID -> LightRecord, WITH ITS CACHED PATHS
+        # A REPARENTING OR A PARENT RENAMED ONLY MARKS THE CACHED PATHS OF THE LIGHTS BELOW IT STALE,
+        # RESOLVED AGAIN WHEN NEXT READ. VISIBILITY CHANGES KEEP THE VISIBILITY LAST APPLIED UP TO DATE
+        self.callbacks = LightCallbackHub(["color", "aiExposure", "aiSamples", "aiAov"], self.updates.push,
+                                          self.scene_lights.invalidate_many, self.visibility_changed)
+        self.mute_solo = MuteSoloState()  # MUTE/SOLO STATE AND VISIBILITY LAST APPLIED TO MAYA
+        self.scene_callbacks = []  # FILE NEW/OPEN CALLBACK IDS, WHILE THE MANAGER IS RUNNING
+        self.tracker = LightSceneTracker()  # LIGHTS CREATED/DELETED SINCE THE LAST REFRESH, ONCE THE SCENE WAS SCANNED
+        self.search_index = LightNameIndex()  # LIGHT NAMES, KEPT IN SYNC WITH THE TABLE ROWS
+        self.names = NameAllocator()  # NEXT FREE LGT_<BASE>_### COUNTERS, FROM THE LISTED LIGHTS
+        self.search_text = ""
+        self.last_search = None  # (TEXT, FUZZY, MATCHES) OF THE LAST QUERY, REUSED WHEN THE NEXT ONE EXTENDS IT
+        self.search_pass = 0  # INCREMENTED BY EVERY QUERY TO CANCEL THE PASS IN FLIGHT
+        self.search_rows = []  # (LIGHT KEY, HIDDEN) CHANGES LEFT TO APPLY BY THE CURRENT PASS
+        self.hidden_lights = set()  # LIGHTS WHOSE ROW IS HIDDEN BY THE SEARCH
+        self.populate_pass = 0  # INCREMENTED BY EVERY REFRESH TO CANCEL THE LISTING IN FLIGHT
+        self.pending_lights = []  # LightRecord OF THE LIGHTS LEFT TO ADD BY THE CURRENT LISTING
+        # CLEARS THE INFO MESSAGE; OWNED BY THE LABEL SO IT DIES WITH THE WINDOW, WITHOUT HOLDING THE LOGIC
+        self.info_clear = QTimer(ui.info_text)
+        self.info_clear.setSingleShot(True)
+        self.info_clear.timeout.connect(ui.info_text.clear)
         self.lightTypes = {
             "aiPhotometricLight": None,
             "aiSkyDomeLight": None,
@@ -33,101 +84,421 @@ class MayaLightLogic(QObject):
             "pointLight": cmds.pointLight,
             "directionalLight": cmds.directionalLight,
         }
+        self.start()
+
+    # LIFECYCLE --------------------------------------
+    def start(self):
+        """
+        Loads the Mute/Solo state of the scene and starts following the scene changes.
+
+        Called on creation and when a closed window is shown again; does nothing
+        if the manager is already running. The lights are listed by the next refresh.
+        """
+        if self.scene_callbacks:
+            return
+        self.mute_solo.restore(read_state())
+        self.scene_callbacks = watch_scene_changes(self.scene_closing, self.scene_opened)
+
+    def release(self, light_table: object = None):
+        """
+        Forgets every listed light: removes their callbacks, drops the pending updates
+        and search pass, and clears the row state.
+
+        Args:
+            light_table (QTableView, optional): The table to empty; left untouched if None
+                (e.g. when the window is already destroyed).
+        """
+        self.callbacks.clear()
+        self.tracker.stop()  # THE NEXT REFRESH SCANS THE SCENE AGAIN
+        self.updates.timer.stop()
+        self.updates.dirty.clear()
+        self.search_pass += 1  # CANCELS THE SEARCH PASS IN FLIGHT
+        self.search_rows = []
+        self.populate_pass += 1  # CANCELS THE LISTING IN FLIGHT
+        self.pending_lights = []
+        self.last_search = None
+        self.hidden_lights.clear()
+        self.search_index = LightNameIndex()
+        self.names = NameAllocator()
+        self.mute_solo = MuteSoloState()
+        self.scene_lights.clear()
+        if light_table is not None:
+            light_table.model().clear_lights()
+            self.ui.set_progress(0, 0)
+
+    def shutdown(self, light_table: object = None):
+        """
+        Stops the manager when its window is closed or destroyed: releases the lights
+        and every Maya callback it registered. `start` brings it back.
+
+        Args:
+            light_table (QTableView, optional): The table to empty, if the window still exists.
+        """
+        unwatch_scene_changes(self.scene_callbacks)
+        self.scene_callbacks = []
+        self.release(light_table)
+
+    def window_destroyed(self, *args: object):
+        """
+        Stops the manager for good when its window is destroyed, and lets go of the window.
 
-    def rename_light(self, old_name: str, new_name: str, light_table: object):
+        Connected as a bound method rather than a closure: PySide keeps the slots
+        of `destroyed` alive, and a closure holding the logic would keep the
+        logic, and through `self.ui` the window wrapper, alive with them.
+        """
+        self.shutdown()
+        self.ui = None
+
+    def scene_closing(self, *args: object):
+        """ Maya callback: the lights of the closing scene are about to be deleted. """
+        self.release(self.ui.light_table)
+
+    def scene_opened(self, *args: object):
+        """ Maya callback: lists the lights of the new scene, with its own Mute/Solo state. """
+        self.mute_solo.restore(read_state())
+        self.refresh(self.ui.light_table)
+
+    @profiled()
+    @undoable("Light Manager: Rename Light")
+    def rename_light(self, light_key: str, new_name: str, light_table: object):
         """
         Renames a light in the Maya scene with a specific naming convention.
 
+        Only the light's row is updated; its callbacks and state are kept, as
+        the light keeps its key (UUID) through the rename.
+
         Args:
-            old_name (str): The current name of the light to rename.
+            light_key (str): The key (transform UUID) of the light to rename.
             new_name (str): The new base name for the light.
-            light_table (QTableWidget): The table widget to refresh after renaming.
+            light_table (QTableView): The table widget showing the light.
         """
+        light = self.scene_lights.get(light_key)
+        if light is None:
+            self.info_timer("Error: The light to rename no longer exists, please refresh.")
+            return
         try:
             # RENAME WITH A NANING CONVENTION
-            cmds.rename(old_name, "LGT_"+new_name+"_000")
-        except ValueError as e:
+            renamed = cmds.rename(light.transform, self.names.allocate(new_name))
+        except (ValueError, RuntimeError) as e:
             self.info_timer(f"Error: Wrong input - {e}")
-        self.refresh(light_table)
-        self.info_timer(f"Light: '{old_name}' renamed to 'LGT_{new_name}_000'")
+            return
+        self.scene_lights.invalidate(light_key)
+        self.update_light_paths([self.scene_lights[light_key]], light_table)
+        # MAYA MAY HAVE CHANGED THE NAME (e.g. AUTO-SUFFIXED ON COLLISION): REPORT THE ONE ACTUALLY GIVEN
+        self.info_timer(f"Light: '{light.name}' renamed to '{renamed}'")
 
-    def refresh(self, light_table: object):
+    def plan_batch_rename(self, pattern: str, replacement: str, regex: bool, light_table: object) -> list:
         """
-        Clears and repopulates the entire UI table with lights from the Maya scene.
+        Computes the renames of the lights selected in the table (see `NameAllocator.plan`).
+
+        Args:
+            pattern (str): The text, or regular expression, to replace in the names.
+            replacement (str): The replacement text.
+            regex (bool): True if `pattern` is a regular expression.
+            light_table (QTableView): The table holding the selection.
 
-        This is the main function for synchronizing the UI with the scene. It first
-        kills all previously created scriptJobs to prevent errors, then finds all
-        lights matching the allowed types, and for each light, it populates a row
-        in the table with all the necessary widgets and callbacks.
+        Returns:
+            list: (light key, current name, new name) per light to rename.
+
+        Raises:
+            re.error: If the regular expression is not valid.
+        """
+        names = {key: self.scene_lights[key].name for key in self.selected_lights(light_table)
+                 if key in self.scene_lights}
+        return self.names.plan(names, pattern, replacement, regex) if pattern else []
+
+    def preview_batch_rename(self, pattern: str, replacement: str, regex: bool, light_table: object):
+        """ Shows the renames a batch rename would make, without changing anything. """
+        try:
+            self.ui.set_rename_preview(self.plan_batch_rename(pattern, replacement, regex, light_table))
+        except re.error as e:
+            self.ui.set_rename_preview(f"Invalid regular expression: {e}")
+
+    @profiled()
+    @undoable("Light Manager: Batch Rename")
+    def batch_rename(self, pattern: str, replacement: str, regex: bool, light_table: object):
+        """
+        Renames the lights selected in the table at once, in one undo step.
+
+        The rows are updated in place, in a single table update, once every
+        light has been renamed.
 
         Args:
-            light_table (QTableWidget): The table widget to refresh.
-        """
-        # KILL ALL EXISTING SCRIPTS JOB TO PREVENT ERRORS WITH DELETED WIDGETS
-        for job_id in self.script_jobs:
-            if cmds.scriptJob(exists=job_id):
-                cmds.scriptJob(kill=job_id, force=True)
-        self.script_jobs.clear()
-        light_table.setRowCount(0)  # CLEAR EXISTING ROWS
-
-        # REPOPULATE THE TABLE
-        all_lights = [cmds.ls(type=Ltype) for Ltype in self.lightTypes]
-        for shapes in all_lights:
-            if shapes:
-
-                for lightshape in shapes:
-                    node_type = cmds.nodeType(lightshape)
-                    transform = cmds.listRelatives(lightshape, parent=True)[0]
-
-                    if node_type in self.lightTypes:
-                        self.light_name_to_list(
-                            lightshape, transform, light_table)
-                        self.mute_solo_to_list(transform, light_table)
-                        self.color_button_to_list(transform, light_table)
-                        self.entry_attr_num_to_list(transform, "aiExposure", 5, light_table)
-                        self.entry_attr_num_to_list(transform, "aiSamples", 6, light_table)
-                        self.entry_attr_text_to_list(f"{lightshape}.aiAov", 7, light_table)
-                        self.info_timer("Light Manager refreshed successfully.")
-                    else:
-                        self.info_timer(f"'{transform}' is not allowed by the manager - warning {node_type}")
+            pattern (str): The text, or regular expression, to replace in the names.
+            replacement (str): The replacement text.
+            regex (bool): True if `pattern` is a regular expression.
+            light_table (QTableView): The table holding the selection.
+        """
+        try:
+            renames = self.plan_batch_rename(pattern, replacement, regex, light_table)
+        except re.error as e:
+            self.info_timer(f"Error: Invalid regular expression - {e}")
+            return
+        renamed, changed, failed = [], [], []
+        for light_key, name, new_name in renames:
+            try:
+                actual = cmds.rename(self.scene_lights[light_key].transform, new_name)
+            except (ValueError, RuntimeError):
+                failed.append(name)
+                continue
+            self.scene_lights.invalidate(light_key)
+            renamed.append(light_key)
+            # MAYA MAY HAVE CHANGED THE NAME (e.g. AUTO-SUFFIXED ON COLLISION): REPORT THE ONE ACTUALLY GIVEN
+            actual = actual.rsplit("|", 1)[-1]
+            if actual != new_name:
+                changed.append(f"'{new_name}' -> '{actual}'")
+        self.update_light_paths([self.scene_lights[key] for key in renamed], light_table)
+        message = f"{len(renamed)} lights renamed."
+        if changed:
+            more = f" (+{len(changed) - RENAME_REPORT_LIMIT} more)" if len(changed) > RENAME_REPORT_LIMIT else ""
+            message += f" Renamed by Maya: {', '.join(changed[:RENAME_REPORT_LIMIT])}{more}."
+        if failed:
+            message += f" Failed to rename: {', '.join(failed)}"
+        self.info_timer(message)
+
+    @profiled()
+    @undoable("Light Manager: Refresh")
+    def refresh(self, light_table: object, full: bool = False):
+        """
+        Synchronizes the UI table with the lights of the Maya scene.
+
+        Instead of clearing and rebuilding every row, only the lights that
+        changed are touched: rows of lights that disappeared are removed
+        together with their callbacks, new lights get a row appended and lights
+        whose type changed have their row rebuilt. Every other row keeps its
+        data and callbacks.
+
+        The first refresh scans the scene and compares it against the lights
+        kept in `self.scene_lights`, by UUID (lights renamed or reparented only
+        get their paths and name updated). From then on, the light shapes
+        created and deleted are recorded as they happen (`LightSceneTracker`),
+        so a refresh only reads those, without listing the scene again: its
+        cost follows the size of the change, not of the scene.
+
+        When many rows have to be added (e.g. the first listing of a big scene),
+        they are added progressively (see `populate_rows`).
+
+        A full refresh scans the scene again even while the changes are
+        recorded, to resync the table with anything the records missed.
+
+        Args:
+            light_table (QTableView): The table widget to refresh.
+            full (bool, optional): Scan the whole scene instead of reading the recorded changes. Defaults to False.
+        """
+        self.populate_pass += 1
+        if full:
+            self.tracker.stop()
+        if self.tracker.tracking:
+            # ONLY THE LIGHTS CREATED OR DELETED SINCE THE LAST REFRESH
+            with measure("diff"):
+                created, deleted = self.tracker.take()
+                removed = {key for key in map(self.callbacks.nodes.get, deleted)
+                           if key is not None and not self.scene_lights.exists(key)}
+                # A SHAPE STILL LISTED (e.g. DELETED THEN RESTORED BY AN UNDO) KEEPS ITS ROW
+                unlisted = removed | {None}
+                created = [handle for handle in created if self.callbacks.nodes.get(handle.hashCode()) in unlisted]
+            self.remove_light_rows(list(removed), light_table)
+            with measure("scene query"):
+                lights = read_lights(created, self.lightTypes, taken=self.scene_lights)
+            changed = removed.intersection(light.uuid for light in lights)
+            moved = []
+            # A LISTING STILL IN FLIGHT GOES ON, WITH THE NEW LIGHTS
+            self.pending_lights = [light for light in self.pending_lights if light.uuid not in removed] + list(lights)
+        else:
+            # SCAN THE SCENE, THEN FOLLOW ITS CHANGES FROM NOW ON
+            with measure("scene query"):
+                scene_lights = {light.uuid: light for light in scan_lights(self.lightTypes)}
+            self.tracker.start(self.lightTypes)
+
+            # DIFF AGAINST THE PREVIOUS SCAN
+            with measure("diff"):
+                removed = [key for key in self.scene_lights if key not in scene_lights]
+                kept = [key for key in scene_lights if key in self.scene_lights]
+                changed = [key for key in kept if self.scene_lights[key].node_type != scene_lights[key].node_type]
+                moved = [key for key in kept if key not in changed and self.scene_lights[key] != scene_lights[key]]
+                added = [key for key in scene_lights if key not in self.scene_lights]
+            self.remove_light_rows(removed + changed, light_table)
+            self.update_light_paths([scene_lights[key] for key in moved], light_table)
+            # A LISTING STILL IN FLIGHT IS CANCELLED: ITS LIGHTS NOT ADDED YET ARE PART OF `added` AGAIN
+            lights = [scene_lights[key] for key in changed + added]
+            removed = removed + changed
+            self.pending_lights = lights
+        self.populate_rows(light_table, self.populate_pass)
+
         cmds.select(clear=True)
+        self.info_timer(f"Light Manager refreshed successfully. "
+                        f"(+{len(lights) - len(changed)} / -{len(removed) - len(changed)} / "
+                        f"~{len(changed) + len(moved)})")
+
+    @profiled()
+    def populate_rows(self, light_table: object, populate_pass: int):
+        """
+        Adds the next chunk of pending lights to the table, then schedules the following one.
+
+        The first chunk is added right away and fills the viewport (it holds
+        more rows than the window can show); the others are added on the event
+        loop, `POPULATE_CHUNK_SIZE` at a time, so Maya stays responsive and a
+        search or a new refresh can run in between.
 
+        Args:
+            light_table (QTableView): The table to add the rows to.
+            populate_pass (int): The listing the chunk belongs to; stale listings stop here.
+        """
+        if populate_pass != self.populate_pass:
+            return  # CANCELLED BY A NEWER REFRESH
+        chunk = self.pending_lights[:POPULATE_CHUNK_SIZE]
+        self.pending_lights = self.pending_lights[POPULATE_CHUNK_SIZE:]
+        self.add_light_rows(chunk, light_table)
+        self.ui.set_progress(len(self.scene_lights), len(self.scene_lights) + len(self.pending_lights))
+        if self.pending_lights:
+            call_soon(partial(self.populate_rows, light_table, populate_pass), light_table)
+        elif chunk:
+            self.apply_solo()  # ONCE THE LISTING IS DONE, NOT ONCE PER CHUNK
+
+    def add_light_rows(self, lights: list, light_table: object):
+        """
+        Appends one row per light to the table model and starts listening to their attributes.
+
+        Args:
+            lights (list): The `LightRecord` of the lights to add.
+            light_table (QTableView): The table to add the rows to.
+        """
+        with measure("attribute read"):
+            snapshot = read_snapshot(lights)
+        if len(snapshot.lights) < len(lights):
+            # SOME PATHS NO LONGER RESOLVE (e.g. A PENDING LIGHT RENAMED, REPARENTED OR DELETED DURING THE LISTING):
+            # THE RECORDED CHANGES DO NOT COVER THEM, SO THE NEXT REFRESH SCANS THE SCENE AGAIN TO LIST THEM
+            self.tracker.stop()
+        with measure("row build"):
+            rows = []
+            for index, light in enumerate(snapshot.lights):
+                self.mute_solo.add(light.uuid, bool(snapshot.columns["visibility"][index]))
+                rows.append(dict(self.light_values(light, snapshot.row(index)),
+                                 visibility=self.mute_solo.enabled[light.uuid],
+                                 solo=light.uuid == self.mute_solo.soloed))
+            light_table.model().add_lights(rows)
+        with measure("callback registration"):
+            for light in snapshot.lights:
+                self.callbacks.watch(light.uuid, light.shape, light.transform)
+        self.scene_lights.add(snapshot.lights)
+        for light in snapshot.lights:
+            self.search_index.add(light.uuid, light.name)
+            self.names.add(light.name)
+        self.last_search = None
+        if self.search_text:
+            # KEEP THE CURRENT SEARCH APPLIED TO THE NEW ROWS
+            self.filter_rows(light_table)
+
+    def remove_light_rows(self, light_keys: list, light_table: object):
+        """
+        Removes the rows of some lights, removing their callbacks and forgetting their last scan.
+
+        Args:
+            light_keys (list): The keys (transform UUIDs) of the lights to remove.
+            light_table (QTableView): The table to remove the rows from.
+        """
+        for light_key in light_keys:
+            # STOP LISTENING TO THE LIGHT TO PREVENT ERRORS WITH DELETED ROWS
+            self.callbacks.unwatch(light_key)
+            self.updates.discard(light_key)
+            self.search_index.remove(light_key)
+            self.mute_solo.remove(light_key)
+            self.hidden_lights.discard(light_key)
+            self.scene_lights.remove(light_key)
+        self.last_search = None
+        light_table.model().remove_lights(light_keys)
+
+    def update_light_paths(self, lights: list, light_table: object):
+        """
+        Takes the new paths of renamed or reparented lights, keeping their rows and callbacks.
+
+        Args:
+            lights (list): The up-to-date `LightRecord` of the lights.
+            light_table (QTableView): The table showing the lights.
+        """
+        if not lights:
+            return
+        self.scene_lights.add(lights)
+        for light in lights:
+            self.search_index.rename(light.uuid, light.name)
+            self.names.add(light.name)
+        self.last_search = None
+        light_table.model().update_lights({light.uuid: {"name": light.name} for light in lights})
+        if self.search_text:
+            self.filter_rows(light_table)
+
+    @profiled()
+    @undoable("Light Manager: Delete Light")
     def delete(self, light_table: object):
         """
-        Deletes the currently selected light from the Maya scene.
+        Deletes the lights selected in the table from the Maya scene.
+
+        The table selection is used rather than the Maya selection, which a
+        refresh clears.
+
         Args:
-            light_table (QTableWidget): The table widget to refresh after deletion.
+            light_table (QTableView): The table widget to refresh after deletion.
         """
-        selection = cmds.ls(selection=True, dagObjects=True)
-        cmds.delete(selection)
+        lights = [self.scene_lights[key] for key in self.selected_lights(light_table) if key in self.scene_lights]
+        if not lights:
+            self.info_timer("No light selected.")
+            return
+        names = [light.name for light in lights]
+        cmds.delete([light.transform for light in lights])
         self.refresh(light_table)
-        self.info_timer(f"Light  '{selection[0]}' deleted successfully.")
+        if len(names) == 1:
+            self.info_timer(f"Light  '{names[0]}' deleted successfully.")
+        else:
+            self.info_timer(f"{len(names)} lights deleted successfully: {', '.join(names)}")
 
+    @undoable("Light Manager: Select Light")
     def light_table_selection(self, lightTable: object):
         """
         Synchronizes the Maya scene selection with the UI table selection.
 
-        When a user selects an item in the table, this function selects the
-        corresponding light node in the Maya scene.
+        When a user selects rows in the table, this function selects the
+        corresponding light nodes in the Maya scene.
 
         Args:
-            lightTable (QTableWidget): The table widget where the selection changed.
-        """
-        selected_items = lightTable.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            light_name_item = lightTable.item(row, 0)
-
-            if light_name_item:
-                light_name = light_name_item.text()
-                cmds.select(clear=True)
-                try:
-                    cmds.select(light_name)
-                except ValueError:
-                    self.info_timer(f"Error:  '{light_name}' None Existent")
-        else:
-            cmds.select(clear=True)
+            lightTable (QTableView): The table view where the selection changed.
+        """
+        light_names = [self.scene_lights[key].transform for key in self.selected_lights(lightTable)
+                       if key in self.scene_lights]
+        cmds.select(clear=True)
+        if light_names:
+            try:
+                cmds.select(light_names)
+            except ValueError:
+                self.info_timer(f"Error:  '{light_names[0]}' None Existent")
 
+    def selected_lights(self, light_table: object) -> list:
+        """
+        Returns the keys of the lights selected in the table, in row order.
+
+        The rows are read from the selection ranges (the table selects whole
+        rows) rather than `selectedRows`, which queries the flags of every cell.
+
+        Args:
+            light_table (QTableView): The table view to read the selection from.
+        """
+        model = light_table.model()
+        rows = {row for selected in light_table.selectionModel().selection()
+                for row in range(selected.top(), selected.bottom() + 1)}
+        return [model.light_key(row) for row in sorted(rows)]
+
+    def edit_targets(self, light_key: str, light_table: object) -> list:
+        """
+        Returns the lights an edit of one light applies to: the whole selection if the light is part of it.
+
+        Args:
+            light_key (str): The key of the edited light.
+            light_table (QTableView): The table where the edit was made.
+        """
+        selected = self.selected_lights(light_table)
+        return selected if light_key in selected else [light_key]
+
+    @profiled()
+    @undoable("Light Manager: Create Light")
     def create_light(self, light_name: str, light_type: str, light_table: object):
         """
         Creates a new light in the Maya scene based on UI inputs.
@@ -138,7 +509,7 @@ class MayaLightLogic(QObject):
         Args:
             light_name (str): The base name for the new light.
             light_type (str): The type of light to create (e.g., 'spotLight', 'aiAreaLight').
-            light_table (QTableWidget): The table to update with the new light.
+            light_table (QTableView): The table to update with the new light.
         """
         if light_type not in self.lightTypes:
             self.info_timer(f"Error: Light type '{light_type}' is invalid or not selected in the ComboBox.")
@@ -150,11 +521,12 @@ class MayaLightLogic(QObject):
         if not light_name.strip():
             light_name = "defaultLight"
 
-        naming_convention = f"LGT_{light_name.upper()}_000"
+        naming_convention = self.names.allocate(light_name.upper())
         light_transform = None
 
         # ARNOLD LIGHT
         if lightType_key in ["aiAreaLight", "aiSkyDomeLight", "aiPhotometricLight"]:
+            import mtoa.utils as au  # LOADED ON THE FIRST ARNOLD LIGHT ONLY, TO KEEP IT OFF THE STARTUP PATH
             light_nodes = au.createLocator(lightType_key, asLight=True)
             light_transform = cmds.rename(light_nodes[1], naming_convention)
         else:
@@ -173,210 +545,108 @@ class MayaLightLogic(QObject):
             self.info_timer(f"Could not find shape node for {light_name}")
             return
 
-        light_shape = light_shape_nodes[0]
+        light, = identify_lights([LightRecord.from_shape(light_shape_nodes[0], lightType_key)])
 
         # POPULATE THE TABLE LIST
-        self.light_name_to_list(light_shape, light_transform, light_table)
-        self.mute_solo_to_list(light_transform, light_table)
-        self.color_button_to_list(light_transform, light_table)
-        self.entry_attr_num_to_list(light_transform, "aiSamples", 6, light_table)
-        self.entry_attr_num_to_list(light_transform, "aiExposure", 5, light_table)
-        self.entry_attr_text_to_list(f"{light_shape}.aiAov", 7, light_table)
+        self.add_light_rows([light], light_table)
+        self.apply_solo()
 
         self.info_timer(f"'{lightType_key}': '{light_name}' has been created successfully.")
 
-    def light_name_to_list(self, light_shape_name: str, light_transform_name: str, light_table: object):
+    def light_values(self, light: LightRecord, attributes: dict) -> dict:
         """
-        Populates the 'Name' and 'Light Type' columns for a new row in the table.
+        Builds the values displayed in a table row for one light.
 
         Args:
-            light_shape_name (str): The name of the light's shape node.
-            light_transform_name (str): The name of the light's transform node.
-            light_table (QTableWidget): The table to add the row to.
-        """
-        self.row_position = light_table.rowCount()
-        light_table.insertRow(self.row_position)
-
-        # POPULATE THE "Name" COLUMN
-        name_item = QTableWidgetItem(light_transform_name)
-        name_item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        light_table.setItem(self.row_position, 0, name_item)
-
-        # POPULATE THE "Light Type" COLUMN
-        light_type = cmds.nodeType(light_shape_name)
-        icon_light_type = QLabel()
+            light (LightRecord): The light to display.
+            attributes (dict): The light's attribute values, as read by `read_snapshot`.
 
-        if light_type in ["aiAreaLight", "aiSkyDomeLight", "aiPhotometricLight"]:
-            icon_path = os.path.join(SCRIPT_PATH, "img", "icons", f"{light_type[2:]}Shelf.png")
-        else:
-            icon_path = os.path.join(SCRIPT_PATH, "img", "icons", f"{light_type}.png")
-            print(icon_path)
-
-        img = QPixmap(icon_path)
-        icon_light_type.setPixmap(img)
-        icon_light_type.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-        light_table.setCellWidget(self.row_position, 3, icon_light_type)
+        Returns:
+            dict: The row values, keyed by table column attribute.
+        """
+        return dict(attributes, key=light.uuid, name=light.name, node_type=light.node_type,
+                    icon=light_icon(light.node_type))
 
-    def mute_solo_to_list(self, light_transform_name: int, light_table: object):
+    def flush_updates(self, dirty: dict):
         """
-        Adds 'Mute' and 'Solo' checkboxes to the current row in the table.
+        Copies the Maya attributes changed since the last UI tick into the table, in one batch.
 
-        Args:
-            light_transform_name (str): The name of the light's transform node.
-            light_table (QTableWidget): The table to add the widgets to.
-        """
-        mute_widget = QWidget()
-        mute_checkbox = QCheckBox()
-        mute_checkbox.setStyleSheet("QCheckBox::indicator:unchecked { background-color: #f94144 }")
-        current_visibility = cmds.getAttr(f"{light_transform_name}.visibility")
-        mute_checkbox.setChecked(bool(current_visibility))
-        mute_checkbox.stateChanged.connect(partial(self.update_all_lights_visibility, light_table))
-        mute_layout = QHBoxLayout(mute_widget)
-        mute_layout.addWidget(mute_checkbox)
-        mute_layout.setAlignment(Qt.AlignCenter)
-        mute_layout.setContentsMargins(0, 0, 0, 0)
-
-        solo_widget = QWidget()
-        solo_checkbox = QCheckBox()
-        solo_checkbox.setStyleSheet("QCheckBox::indicator:checked { background-color: #adb5bd }")
-        solo_checkbox.stateChanged.connect(partial(self.on_solo_toggled, self.row_position, light_table))
-        solo_layout = QHBoxLayout(solo_widget)
-        solo_layout.addWidget(solo_checkbox)
-        solo_layout.setAlignment(Qt.AlignCenter)
-        solo_layout.setContentsMargins(0, 0, 0, 0)
-
-        light_table.setCellWidget(self.row_position, 1, mute_widget)
-        light_table.setCellWidget(self.row_position, 2, solo_widget)
-
-    def color_button_to_list(self, light_transform_name: str, light_table: object):
-        """
-        Adds a color swatch button to the current row in the table.
+        Renamed lights (a 'name' change, e.g. from the Outliner) have their
+        paths resolved again and only their row updated. Lights deleted since
+        the change was queued are left to the next refresh.
 
         Args:
-            light_transform_name (str): The name of the light's transform node.
-            light_table (QTableWidget): The table to add the widget to.
+            dirty (dict): The changed attributes per light key.
         """
-        colorBtn_widget = QWidget()
-        colorBtn = QPushButton()
-        colorBtn.setFixedSize(40, 20)
-        self.set_button_color(light_transform_name, colorBtn)
-        colorBtn.clicked.connect(partial(self.set_color, light_transform_name, colorBtn))
-        colorBtn_layout = QHBoxLayout(colorBtn_widget)
-        colorBtn_layout.addWidget(colorBtn)
-        colorBtn_layout.setAlignment(Qt.AlignCenter)
-        colorBtn_layout.setContentsMargins(0, 0, 0, 0)
-        light_table.setCellWidget(self.row_position, 4, colorBtn_widget)
+        renamed = [key for key, attributes in dirty.items() if "name" in attributes and self.scene_lights.exists(key)]
+        for key in renamed:
+            self.scene_lights.invalidate(key)
+        self.update_light_paths([self.scene_lights[key] for key in renamed], self.ui.light_table)
+
+        dirty = {key: attributes - {"name"} for key, attributes in dirty.items() if attributes - {"name"}}
+        lights = [self.scene_lights[key] for key in dirty if key in self.scene_lights]
+        snapshot = read_snapshot(lights, set().union(*dirty.values()))
+        values = {}
+        for index, light in enumerate(snapshot.lights):
+            row = snapshot.row(index)
+            values[light.uuid] = {attribute: row[attribute] for attribute in dirty[light.uuid]}
+        self.ui.light_table.model().update_lights(values)
 
-    def entry_attr_num_to_list(self, light_transform_name: str, attribute_name: str, column: int, light_table: object):
+    @undoable("Light Manager: Edit Light")
+    def light_edited(self, light_key: str, attribute: str, value: object, light_table: object):
         """
-        Adds a numeric input field to a cell for a specific attribute.
+        Applies an edit made in the table to the Maya scene.
 
-        This creates a two-way binding: changes in the UI update Maya, and
-        changes in Maya (via a scriptJob) update the UI.
+        When the edited row is part of a multi-row selection, the new value is
+        applied to every selected light in one pass and one undo step (except
+        for the solo, which only ever applies to one light).
 
         Args:
-            light_transform_name (str): The light's transform node name.
-            attribute_name (str): The name of the numeric attribute to control (e.g., 'aiExposure').
-            column (int): The table column index to place this widget in.
-            light_table (QTableWidget): The table to add the widget to.
-        """
-        full_attr_name = f"{light_transform_name}.{attribute_name}"
-        current_value = cmds.getAttr(full_attr_name)
-        # SETTING THE CURRENT VALUE IN THE UI
-        bar_text = CustomLineEditNum()
-        if isinstance(current_value, (float)):
-            bar_text.setText(f"{current_value:.3f}")
-        elif isinstance(current_value, (int)):
-            bar_text.setText(f"{current_value}")
-        bar_text.setFixedSize(74, 29)
-        bar_text.setAlignment(Qt.AlignCenter)
-        bar_text.setContentsMargins(0, 0, 0, 0)
-
-        def _update_maya_from_ui():
-            # GET VALUE FROM UI
+            light_key (str): The key (transform UUID) of the edited light.
+            attribute (str): The edited attribute ('visibility', 'solo', 'aiExposure', 'aiSamples' or 'aiAov').
+            value (object): The new value, as entered in the table.
+            light_table (QTableView): The table where the edit was made.
+        """
+        if attribute == "solo":
+            self.on_solo_toggled(light_key, light_table, value)
+            return
+        model = light_table.model()
+        targets = self.edit_targets(light_key, light_table)
+        if attribute == "visibility":
+            for target in targets:
+                self.mute_solo.set_enabled(target, value)
+            model.update_lights({target: {"visibility": value} for target in targets})
+            self.update_all_lights_visibility(light_table)
+            return
+
+        if attribute != "aiAov":
             try:
-                # SET VALUE IN MAYA
-                new_value = float(bar_text.text())
-                cmds.setAttr(full_attr_name, new_value)
-            except (ValueError, RuntimeError) as e:
+                value = float(value)
+            except ValueError:
                 self.info_timer(f"Wrong input:  Please enter a number")
-                # ON ERROR, Reset the text to the current value in MAYA
-                current_maya_val = cmds.getAttr(full_attr_name)
-                if isinstance(current_maya_val, (float)):
-                    bar_text.setText(f"{current_maya_val:.3f}")
-                elif isinstance(current_maya_val, (int)):
-                    bar_text.setText(f"{current_maya_val}")
-        bar_text.returnPressed.connect(_update_maya_from_ui)
-
-        def _update_ui_from_maya(*_: str):
-            if not cmds.objExists(light_transform_name):
                 return
-            # AVOIDING AN INFINITE LOOP BETWEEN THE UI AND MAYA
-            bar_text.blockSignals(True)
-            new_value = cmds.getAttr(full_attr_name)
+        lights = [self.scene_lights[target] for target in targets if target in self.scene_lights]
+        for light in lights:
             try:
-                if isinstance(new_value, (float)):
-                    bar_text.setText(f"{new_value:.3f}")
-                elif isinstance(new_value, (int)):
-                    bar_text.setText(f"{new_value}")
-            finally:
-                # RE-ESTABLISHE THE SIGNAL
-                bar_text.blockSignals(False)
-
-        # CREATE A SCRIPT JOB TO LISTEN FOR CHANGES AND STORE ID FOR CLEANUP
-        job_id = cmds.scriptJob(attributeChange=[full_attr_name, _update_ui_from_maya])
-        self.script_jobs.append(job_id)
-        light_table.setCellWidget(self.row_position, column, bar_text)
-
-    def entry_attr_text_to_list(self, light_shape_name: str, column: int, light_table: object):
-        """
-        Adds a text input field to a cell for a specific string attribute.
-
-        This creates a two-way binding: changes in the UI update Maya, and
-        changes in Maya (via a scriptJob) update the UI.
-
-        Args:
-            light_shape_name (str): The light's shape node name (including attribute).
-            column (int): The table column index to place this widget in.
-            light_table (QTableWidget): The table to add the widget to.
-        """
-        full_attr_name = f"{light_shape_name}"
-        current_value = cmds.getAttr(full_attr_name)
-        bar_text = QLineEdit(placeholderText=current_value)
-        bar_text.setFixedSize(59, 29)
-        bar_text.setAlignment(Qt.AlignCenter)
-        bar_text.setContentsMargins(0, 0, 0, 0)
-
-        def _update_maya_from_ui():
-            new_value = bar_text.text()
-            try:
-                cmds.setAttr(full_attr_name, new_value, type='string')
-                self.info_timer(
-                    text=f"{light_shape_name.split('.')[0].split('|')[2]} set AOV: '{new_value}'")
+                if attribute == "aiAov":
+                    cmds.setAttr(f"{light.shape}.{attribute}", value, type='string')
+                else:
+                    cmds.setAttr(f"{light.shape}.{attribute}", value)
             except (ValueError, RuntimeError) as e:
                 self.info_timer(f"Invalid input : {e}")
-                # ON ERROR, Reset the text to the current value in MAYA
-                current_maya_val = cmds.getAttr(full_attr_name)
-                bar_text.setText(current_maya_val)
-        bar_text.returnPressed.connect(_update_maya_from_ui)
-
-        def _update_ui_from_maya(*_: str):
-            if not cmds.objExists(light_shape_name):
-                return
-            # AVOIDING AN INFINITE LOOP BETWEEN THE UI AND MAYA
-            bar_text.blockSignals(True)
-            new_value = cmds.getAttr(full_attr_name)
-            try:
-                bar_text.setText(new_value)
-            finally:
-                bar_text.blockSignals(False)
+                break
+        else:
+            if attribute == "aiAov":
+                names = lights[0].name if len(lights) == 1 else f"{len(lights)} lights"
+                self.info_timer(text=f"{names} set AOV: '{value}'")
 
-        # CREATE A SCRIPT JOB TO LISTEN FOR CHANGES AND STORE ID FOR CLEANUP
-        job_id = cmds.scriptJob(attributeChange=[full_attr_name, _update_ui_from_maya])
-        self.script_jobs.append(job_id)
-        light_table.setCellWidget(self.row_position, column, bar_text)
+        # KEEP THE TABLE ON THE VALUES ACTUALLY STORED IN MAYA
+        snapshot = read_snapshot(lights, [attribute])
+        model.update_lights({light.uuid: {attribute: snapshot.columns[attribute][index]}
+                             for index, light in enumerate(snapshot.lights)})
 
-    def on_solo_toggled(self, toggled_row: int, light_table: object, state: bool):
+    @undoable("Light Manager: Solo")
+    def on_solo_toggled(self, light_key: str, light_table: object, state: bool):
         """
         Callback for when a 'Solo' checkbox is toggled.
 
@@ -384,128 +654,226 @@ class MayaLightLogic(QObject):
         it unchecks any other currently soloed box, then triggers a visibility update.
 
         Args:
-            toggled_row (int): The row index of the checkbox that was changed.
-            light_table (QTableWidget): The table containing the widgets.
+            light_key (str): The key (transform UUID) of the light whose checkbox was changed.
+            light_table (QTableView): The table containing the light.
             state (bool): The new state of the checkbox (True if checked).
         """
-        if state:
-            # SKIP the ROW OF THE CHECKBOX THAT WAS JUST TOGGLED
-            for i in range(light_table.rowCount()):
-                if i != toggled_row:
-                    solo_widget = light_table.cellWidget(i, 2)
-                    if solo_widget:
-                        # RETRIEVE THE CUSTOM WIDGET IN THE  'Solo' COLUMN
-                        solo_checkbox = solo_widget.findChild(QCheckBox)
-                        if solo_checkbox and solo_checkbox.isChecked():     # PREVENT RECURSIVE CALLS OF THIS FUNCTION
-                            solo_checkbox.blockSignals(True)
-                            # UNCHECKED THE PREVIOUS SOLOED CHECKBOX
-                            solo_checkbox.setChecked(False)
-                            solo_checkbox.blockSignals(False)
+        previous = self.mute_solo.set_solo(light_key, state)
+        if previous is not None:
+            # UNCHECK THE PREVIOUS SOLOED LIGHT
+            light_table.model().update_light(previous, {"solo": False})
         self.update_all_lights_visibility(light_table)
 
+    @profiled()
+    @undoable("Light Manager: Mute/Solo")
     def update_all_lights_visibility(self, light_table: object, *args: str):
         """
-        Updates the visibility of all lights based on the UI's Mute/Solo states.
+        Applies the Mute/Solo state to the visibility of the lights in Maya.
 
         Logic:
-        1. Checks if any light is currently soloed.
-        2. If a light is soloed, it makes only that light visible.
-        3. If no light is soloed, it sets each light's visibility based on its
-           own 'Mute' checkbox state.
+        1. If a light is soloed, only that light should be visible.
+        2. If no light is soloed, each light should be visible unless muted.
+        3. Only the lights whose visibility differs from the one last applied
+           are written, all in a single undo step: switching the solo from one
+           light to another touches two lights, whatever the size of the scene.
+        4. The Mute/Solo state is saved in the scene in the same undo step, so
+           the solo can be reverted after a refresh, a restart or a scene reopen.
+
+        The visibility last applied is kept up to date by the visibility
+        callbacks (`visibility_changed`), including the changes made by an undo
+        or the Outliner, so nothing is read back from Maya.
 
         Args:
-            light_table (QTableWidget): The table containing the Mute/Solo widgets.
+            light_table (QTableView): The table containing the Mute/Solo states.
             *args: Catches any extra arguments passed by Qt signals.
         """
-        soloed_row = -1
-        # CHECK IF ANY LIGHT IS SOLOED
-        for i in range(light_table.rowCount()):
-            solo_widget = light_table.cellWidget(i, 2)
-            if solo_widget:
-                solo_checkbox = solo_widget.findChild(QCheckBox)
-                if solo_checkbox and solo_checkbox.isChecked():
-                    # IF A SOLO CHECKBOX IS FOUND AND CHECKED, STORE ITS ROW INDEX
-                    soloed_row = i
-                    break
-
-        # ITERATE THROUGH ALL LIGHTS TO SET THEIR VISIBILITY
-        for i in range(light_table.rowCount()):
-            light_name_item = light_table.item(i, 0)
-            mute_widget = light_table.cellWidget(i, 1)
-
-            if not (light_name_item and mute_widget):
-                continue
+        self.apply_visibility()
+        write_state(self.mute_solo.to_data())
 
-            light_name = light_name_item.text()
-            if not cmds.objExists(light_name):
-                continue
-            mute_checkbox = mute_widget.findChild(QCheckBox)
+    def apply_visibility(self):
+        """
+        Writes the visibility of the lights whose target differs from the one last applied.
 
-            if cmds.objExists(light_name) and mute_checkbox:
-                is_visible = (i == soloed_row) if soloed_row != -1 else mute_checkbox.isChecked()
+        Nothing is saved: callers persisting a change of the Mute/Solo state call `write_state`.
+        """
+        applied = {}
+        for light_key, is_visible in self.mute_solo.changes().items():
+            try:
                 # SET THE VISIBILITY OF THE CORRESPONDING LIGHT IN MAYA.
-                cmds.setAttr(f"{light_name}.visibility", is_visible)
+                cmds.setAttr(f"{self.scene_lights[light_key].transform}.visibility", is_visible)
+            except (ValueError, RuntimeError):  # LIGHT DELETED OUTSIDE THE MANAGER
+                continue
+            applied[light_key] = is_visible
+        self.mute_solo.mark_applied(applied)
+
+    def visibility_changed(self, light_key: str, visible: bool):
+        """ Hub callback: the visibility of a light's transform was set in Maya (by the manager, an undo, ...). """
+        if light_key in self.mute_solo.applied:
+            self.mute_solo.mark_applied({light_key: visible})
+
+    def apply_solo(self):
+        """
+        Hides the lights added while a solo is active (e.g. listed after the solo, or created during it).
+
+        Only their visibility is written, in one undo step: adding lights does
+        not change the Mute/Solo state saved in the scene.
+        """
+        if self.mute_solo.soloed in self.mute_solo.enabled and self.mute_solo.changes():
+            with undo_chunk("Light Manager: Solo"):
+                self.apply_visibility()
 
-    def set_color(self, light_name: str, color_button: QPushButton):
+    @undoable("Light Manager: Set Light Color")
+    def set_color(self, light_key: str, light_table: object):
         """
         Opens the Maya color editor to set a light's color.
 
+        If the light is part of a multi-row selection, the chosen color is
+        applied to every selected light.
+
         Args:
-            light_name (str): The name of the light to modify.
-            color_button (QPushButton): The button in the UI whose color will be updated.
+            light_key (str): The key (transform UUID) of the light to modify.
+            light_table (QTableView): The table whose color swatch will be updated.
         """
-        if not isinstance(light_name, str) or not cmds.objExists(light_name):
-            self.info_timer(f"Error: Light '{light_name}' does not exist or is invalid.")
+        light = self.scene_lights.get(light_key)
+        if light is None or not cmds.objExists(light.shape):
+            self.info_timer("Error: The light does not exist or is invalid, please refresh.")
             return
 
         # GET THE ACTUAL LIGHT COLOR
-        lightColor = cmds.getAttr(light_name + ".color")[0]
+        lightColor = cmds.getAttr(light.shape + ".color")[0]
         # OPEN MAYA COLOR EDITOR
         color = cmds.colorEditor(rgbValue=lightColor)
         r, g, b, a = [float(c) for c in color.split()]  # RGB in string values
-        cmds.setAttr(light_name + ".color", r, g, b, type="double3")  # SET THE COLOR IN MAYA
-        self.set_button_color(light_name, color_button, (r, g, b))
+        targets = [self.scene_lights[key] for key in self.edit_targets(light_key, light_table)
+                   if key in self.scene_lights]
+        for target in targets:
+            cmds.setAttr(target.shape + ".color", r, g, b, type="double3")  # SET THE COLOR IN MAYA
+        light_table.model().update_lights({target.uuid: {"color": (r, g, b)} for target in targets})
 
-    def set_button_color(self, light_name: int, color_button: QPushButton, color: tuple = None):
+    @profiled()
+    def adjust_lights(self, operation: str, value: str, light_table: object):
         """
-        Sets the background color of a button to match a light's color.
+        Applies a relative adjustment to the lights selected in the table.
+
+        The values are computed as NumPy array operations over all the selected
+        lights and written back in one pass and one undo step (see `LightAdjust`).
+        NumPy is only imported on the first adjustment, off the startup path.
 
         Args:
-            light_name (str): The name of the light to get the color from.
-            color_button (QPushButton): The UI button to update.
-            color (tuple, optional): The RGB color to set. If None, it's fetched from Maya.
-        """
-        if not isinstance(light_name, str) or not cmds.objExists(light_name):
-            self.info_timer(f"Error:  '{light_name}' does not exist or is invalid.")
+            operation (str): 'exposure' (add stops), 'samples' (scale), 'color' (multiply by a tint)
+                or 'normalize' (equalize intensity * 2^exposure, optionally to a target in stops).
+            value (str): The operand as typed in the UI: one number, or three for a color tint.
+            light_table (QTableView): The table the lights are selected in.
+        """
+        lights = [self.scene_lights[key] for key in self.selected_lights(light_table) if key in self.scene_lights]
+        if not lights:
+            self.info_timer("Select the lights to adjust first.")
             return
-
-        if not color:  # IF NOT, GET COLOR FROM MAYA
-            color = cmds.getAttr(light_name + ".color")[0]
-        if not isinstance(color, tuple):
-            self.info_timer(f"Error:  Invalid color format for '{light_name}': {color}")
+        try:
+            numbers = [float(number) for number in value.replace(",", " ").split()]
+        except ValueError:
+            numbers = None
+        # NUMBER OF OPERANDS ACCEPTED BY EACH OPERATION
+        if numbers is None or len(numbers) not in {"color": (1, 3), "normalize": (0, 1)}.get(operation, (1,)):
+            self.info_timer("Wrong input: Please enter a number")
+            return
+        try:
+            import LightAdjust  # LOADS NUMPY ON THE FIRST ADJUSTMENT ONLY, TO KEEP IT OFF THE STARTUP PATH
+        except ImportError as e:
+            self.info_timer(f"Error: Adjustments need NumPy - {e}")
             return
-        r, g, b = [c * 255 for c in color]
-        color_button.setStyleSheet(f"background-color: rgba({r},{g},{b}, 1.0)")
 
+        start = time.perf_counter()
+        if operation == "exposure":
+            values, attribute = LightAdjust.add_exposure(lights, numbers[0]), "aiExposure"
+        elif operation == "samples":
+            values, attribute = LightAdjust.scale_samples(lights, numbers[0]), "aiSamples"
+        elif operation == "color":
+            values, attribute = LightAdjust.multiply_color(lights, numbers[0] if len(numbers) == 1 else numbers), "color"
+        else:
+            values, attribute = LightAdjust.normalize_intensities(lights, numbers[0] if numbers else None), "aiExposure"
+        light_table.model().update_lights({key: {attribute: new_value} for key, new_value in values.items()})
+        self.info_timer(f"Adjusted {len(values)} lights in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
+    @profiled()
     def search_light(self, *args: str | object):
         """
         Filters the visibility of rows in the table based on a search string.
 
+        Matches come from the name index: lights whose name contains the text,
+        or, when none does, whose name contains its characters in order. Only
+        the rows whose visibility changes are touched, and clearing the search
+        simply shows the hidden rows again.
+
         Args:
             args[0] (str): The text to search for in the light names.
-            args[1] (QTableWidget): The table whose rows will be filtered.
+            args[1] (QTableView): The table whose rows will be filtered.
         """
-        search_text = args[0]
-        if not search_text:
-            self.refresh(args[1])
-            return
-        if search_text:
-            for row in range(args[1].rowCount()):
-                researsh_light = args[1].item(row, 0).text()
-                if search_text in researsh_light.lower():
-                    args[1].showRow(row)
-                else:
-                    args[1].hideRow(row)
+        self.search_text = args[0]
+        self.filter_rows(args[1])
+
+    def match_lights(self, text: str) -> set:
+        """
+        Returns the keys of the lights matching a search text.
+
+        When the text extends the previous query, only the previous matches are
+        filtered again instead of querying the whole index.
+
+        Args:
+            text (str): The text to search for.
+        """
+        def _search(fuzzy: bool) -> set:
+            within = None
+            if self.last_search:
+                last_text, last_fuzzy, last_matches = self.last_search
+                if last_fuzzy == fuzzy and last_text.lower() in text.lower():
+                    within = last_matches
+            matches = self.search_index.search(text, fuzzy=fuzzy, within=within)
+            self.last_search = (text, fuzzy, matches)
+            return matches
+
+        return _search(fuzzy=False) or _search(fuzzy=True)
+
+    def filter_rows(self, light_table: object):
+        """
+        Hides the rows not matching the current search and shows the others.
+
+        The rows to change are applied in chunks of `SEARCH_CHUNK_SIZE` on the
+        event loop, so typing stays responsive on big scenes; a newer query
+        cancels the pass in flight and starts from the rows actually applied.
+
+        Args:
+            light_table (QTableView): The table whose rows will be filtered.
+        """
+        hidden_lights = self.scene_lights.keys() - self.match_lights(self.search_text) if self.search_text else set()
+        self.search_pass += 1
+        self.search_rows = [(light_key, True) for light_key in hidden_lights - self.hidden_lights]
+        self.search_rows += [(light_key, False) for light_key in self.hidden_lights - hidden_lights]
+        self.apply_search_rows(light_table, self.search_pass)
+
+    def apply_search_rows(self, light_table: object, search_pass: int):
+        """
+        Applies the next chunk of row changes of a search pass, then schedules the following one.
+
+        Args:
+            light_table (QTableView): The table whose rows are filtered.
+            search_pass (int): The pass the chunk belongs to; stale passes stop here.
+        """
+        if search_pass != self.search_pass:
+            return  # CANCELLED BY A NEWER QUERY
+        model = light_table.model()
+        chunk, self.search_rows = self.search_rows[:SEARCH_CHUNK_SIZE], self.search_rows[SEARCH_CHUNK_SIZE:]
+        for light_key, hidden in chunk:
+            row = model.light_row(light_key)
+            if row < 0:
+                continue
+            light_table.setRowHidden(row, hidden)
+            if hidden:
+                self.hidden_lights.add(light_key)
+            else:
+                self.hidden_lights.discard(light_key)
+        if self.search_rows:
+            call_soon(partial(self.apply_search_rows, light_table, search_pass), light_table)
 
     def render(self):
         """ Sets the current renderer to Arnold and opens the Arnold Render View. """
@@ -517,9 +885,11 @@ class MayaLightLogic(QObject):
         """
         Displays a message in the UI's info label for a specified duration.
 
+        A new message restarts the countdown, so it is never cleared early by an older one.
+
         Args:
             text (str): The message to display.
             duration_ms (int, optional): How long to display the message in milliseconds. Defaults to 3500.
         """
         self.ui.info_text.setText(text)
-        QTimer.singleShot(duration_ms, lambda: self.ui.info_text.setText(""))
+        self.info_clear.start(duration_ms)
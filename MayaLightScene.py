@@ -0,0 +1,342 @@
+from contextlib import contextmanager
+from functools import wraps
+from typing import NamedTuple
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+from LightProfiler import CALLS
+
+cmds = CALLS.proxy(cmds)  # COUNTS THE MAYA CALLS WHEN ENABLED
+
+# ATTRIBUTES DISPLAYED BY THE MANAGER AND HOW TO READ THEM FROM A PLUG
+SNAPSHOT_ATTRIBUTES = ("visibility", "color", "aiExposure", "aiSamples", "aiAov")
+TRANSFORM_ATTRIBUTES = ("visibility",)  # READ ON THE TRANSFORM, EVERYTHING ELSE ON THE SHAPE
+PLUG_READERS = {
+    "visibility": lambda plug: plug.asBool(),
+    "color": lambda plug: tuple(plug.child(i).asFloat() for i in range(plug.numChildren())),
+    "intensity": lambda plug: plug.asFloat(),
+    "aiExposure": lambda plug: plug.asFloat(),
+    "aiSamples": lambda plug: plug.asInt(),
+    "aiAov": lambda plug: plug.asString(),
+}
+
+
+class LightRecord(NamedTuple):
+    """
+    An immutable description of one light found in the Maya scene.
+
+    Attributes:
+        shape (str): The full DAG path of the light's shape node.
+        transform (str): The full DAG path of the light's transform node.
+        node_type (str): The exact node type of the shape (e.g., 'spotLight', 'aiAreaLight').
+        uuid (str): The UUID of the light's transform, which identifies the light in the manager
+            ('' until read by `identify_lights`), suffixed with its namespace for a referenced light
+            (see `identify_lights`).
+    """
+    shape: str
+    transform: str
+    node_type: str
+    uuid: str = ""
+
+    @property
+    def name(self) -> str:
+        """ The short name of the light's transform, as displayed in the UI. """
+        return self.transform.rsplit("|", 1)[-1]
+
+    @classmethod
+    def from_shape(cls, light_shape: str, node_type: str) -> "LightRecord":
+        """
+        Builds a record from the full DAG path of a light shape.
+
+        The parent transform is the shape path without its last component,
+        so no extra query is sent to Maya.
+
+        Args:
+            light_shape (str): The full DAG path of the light's shape node.
+            node_type (str): The node type of the shape.
+        """
+        return cls(light_shape, light_shape.rsplit("|", 1)[0], node_type)
+
+
+def scan_lights(light_types: object) -> tuple:
+    """
+    Gathers every supported light of the scene in a single Maya call.
+
+    One multi-type `ls` returns the full path and the exact type of every
+    shape; the parent transform is derived from the full path. This replaces
+    the per-type `ls` plus the per-shape `nodeType`/`listRelatives` queries.
+
+    Args:
+        light_types (iterable): The light node types handled by the manager.
+
+    Returns:
+        tuple: One `LightRecord` per light shape, in scene order.
+    """
+    light_types = list(light_types)
+    if not light_types:
+        return ()
+    # ls -showType RETURNS A FLAT [name, type, name, type, ...] LIST
+    found = cmds.ls(type=light_types, long=True, showType=True) or []
+    return identify_lights(LightRecord.from_shape(shape, node_type)
+                           for shape, node_type in zip(found[::2], found[1::2])
+                           if node_type in light_types)
+
+
+def identify_lights(lights: object, taken: object = ()) -> tuple:
+    """
+    Fills in the UUID of many lights through the OpenMaya API, without any Maya command.
+
+    UUIDs are not unique across references (a file referenced twice gives
+    the same UUIDs to both copies), so a light in a namespace is keyed by its
+    UUID plus its namespace: the key is the same whatever the scan order and
+    from one session to the next, so the Mute/Solo state saved with it is
+    restored on reopen. Any other light whose UUID is already used is keyed
+    by the UUID plus the hash of its node handle, which only holds for the
+    session: the Mute/Solo state of such a copy is not restored on reopen.
+
+    Args:
+        lights (iterable): The `LightRecord` of the lights.
+        taken (container, optional): The keys already used by other lights (e.g. the listed ones).
+
+    Returns:
+        tuple: The records with their UUID; lights whose transform no longer exists are left out.
+    """
+    identified = []
+    seen = set()
+    selection = om.MSelectionList()
+    for light in lights:
+        selection.clear()
+        try:
+            selection.add(light.transform)
+        except RuntimeError:
+            continue
+        node = selection.getDependNode(0)
+        function = om.MFnDependencyNode(node)
+        uuid = function.uuid().asString()
+        namespace = function.name().rpartition(":")[0]
+        if namespace:
+            uuid = f"{uuid}:{namespace}"
+        if uuid in seen or uuid in taken:
+            uuid = f"{uuid}:{om.MObjectHandle(node).hashCode()}"
+        seen.add(uuid)
+        identified.append(light._replace(uuid=uuid))
+    return tuple(identified)
+
+
+def read_lights(handles: object, light_types: object, taken: object = ()) -> tuple:
+    """
+    Builds the records of light shapes known by their node handle, through the OpenMaya API.
+
+    Args:
+        handles (iterable): The `MObjectHandle` of the light shapes.
+        light_types (iterable): The light node types handled by the manager; other nodes are left out.
+        taken (container, optional): The keys already used by other lights (see `identify_lights`).
+
+    Returns:
+        tuple: One `LightRecord` per light shape that still exists.
+    """
+    light_types = set(light_types)
+    lights = []
+    for handle in handles:
+        if not handle.isValid():
+            continue  # DELETED SINCE
+        node = handle.object()
+        node_type = om.MFnDependencyNode(node).typeName
+        if node_type in light_types:
+            lights.append(LightRecord.from_shape(om.MDagPath.getAPathTo(node).fullPathName(), node_type))
+    return identify_lights(lights, taken)
+
+
+class LightRegistry:
+    """
+    The lights listed by the manager, keyed by the UUID of their transform.
+
+    Each light keeps its `LightRecord`, whose long paths are a cache, and
+    handles on its nodes. A UUID survives renames, reparenting and duplicate
+    short names, so none of them changes the key of a light (its row, its
+    callbacks, its Mute/Solo state). When the paths of a light may be out of
+    date, the light is only marked stale (`invalidate`); its paths are resolved
+    again from the node handles, without any Maya command, when it is next read.
+    """
+
+    def __init__(self):
+        """ Initializes an empty registry. """
+        self.records = {}  # UUID -> LightRecord, WITH THE CACHED PATHS
+        self.handles = {}  # UUID -> (TRANSFORM HANDLE, SHAPE HANDLE)
+        self.stale = set()  # UUIDS WHOSE CACHED PATHS MAY BE OUT OF DATE
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, key: str) -> LightRecord:
+        if key in self.stale:
+            self.resolve(key)
+        return self.records[key]
+
+    def keys(self):
+        """ The UUIDs of the registered lights. """
+        return self.records.keys()
+
+    def get(self, key: str, default: object = None) -> LightRecord:
+        """ Returns the up-to-date record of a light, or `default` if it is not registered. """
+        return self[key] if key in self.records else default
+
+    def add(self, lights: object):
+        """
+        Registers lights (records with their UUID), or refreshes the cached record of registered ones.
+
+        Lights whose nodes can no longer be found (e.g. renamed then deleted
+        before the update reached the manager) are skipped.
+
+        Args:
+            lights (iterable): The `LightRecord` of the lights.
+        """
+        selection = om.MSelectionList()
+        for light in lights:
+            selection.clear()
+            try:
+                selection.add(light.transform)
+                selection.add(light.shape)
+            except RuntimeError:  # NODE DELETED SINCE THE RECORD WAS READ: LEFT TO THE NEXT REFRESH
+                continue
+            self.records[light.uuid] = light
+            self.stale.discard(light.uuid)
+            self.handles[light.uuid] = (om.MObjectHandle(selection.getDependNode(0)),
+                                        om.MObjectHandle(selection.getDependNode(1)))
+
+    def exists(self, key: str) -> bool:
+        """ True if the light is registered and its nodes still exist in the scene. """
+        return key in self.handles and all(handle.isValid() for handle in self.handles[key])
+
+    def remove(self, key: str):
+        """ Forgets a light; unknown keys are ignored. """
+        self.records.pop(key, None)
+        self.handles.pop(key, None)
+        self.stale.discard(key)
+
+    def clear(self):
+        """ Forgets every light. """
+        self.records.clear()
+        self.handles.clear()
+        self.stale.clear()
+
+    def invalidate(self, key: str):
+        """ Marks the cached paths of a light as possibly out of date (e.g. after a rename or a reparent). """
+        if key in self.records:
+            self.stale.add(key)
+
+    def invalidate_many(self, keys: object):
+        """ Marks the cached paths of some lights as possibly out of date (e.g. below a renamed parent group). """
+        self.stale.update(key for key in keys if key in self.records)
+
+    def resolve(self, key: str) -> LightRecord:
+        """
+        Reads the current paths of a light from its node handles and caches them.
+
+        Returns:
+            LightRecord: The up-to-date record; the cached one if a node no longer exists.
+        """
+        self.stale.discard(key)
+        light = self.records[key]
+        handles = self.handles[key]
+        if not self.exists(key):
+            return light  # DELETED: LEFT TO THE NEXT REFRESH
+        transform, shape = (om.MDagPath.getAPathTo(handle.object()).fullPathName() for handle in handles)
+        self.records[key] = light = light._replace(shape=shape, transform=transform)
+        return light
+
+
+class LightSnapshot(NamedTuple):
+    """
+    The displayed attributes of many lights, stored column by column.
+
+    Attributes:
+        lights (tuple): The `LightRecord` of each light.
+        columns (dict): One tuple of values per attribute, aligned with `lights`.
+    """
+    lights: tuple
+    columns: dict
+
+    def row(self, index: int) -> dict:
+        """ Returns the values of one light, keyed by attribute. """
+        return {attribute: values[index] for attribute, values in self.columns.items()}
+
+
+def read_snapshot(lights: object, attributes: object = SNAPSHOT_ATTRIBUTES) -> LightSnapshot:
+    """
+    Reads some attributes of many lights in a single pass through the OpenMaya API.
+
+    Every node is resolved once through one selection list and each value is
+    read straight from its plug, instead of one `cmds.getAttr` round trip per
+    light and per attribute. A missing attribute (e.g. Arnold not loaded) reads
+    as None and lights whose nodes no longer exist are left out.
+
+    Args:
+        lights (iterable): The `LightRecord` of the lights to read.
+        attributes (iterable, optional): The attributes to read. Defaults to `SNAPSHOT_ATTRIBUTES`.
+
+    Returns:
+        LightSnapshot: The values read, column by column.
+    """
+    attributes = tuple(attributes)
+    # RESOLVE EVERY NODE ONCE (A SELECTION LIST DOES NOT HOLD DUPLICATES, SO INDEX THE UNIQUE PATHS)
+    nodes = {}
+    selection = om.MSelectionList()
+    for path in dict.fromkeys(path for light in lights for path in (light.shape, light.transform)):
+        try:
+            selection.add(path)
+        except RuntimeError:  # NODE DELETED SINCE THE LAST SCAN
+            continue
+        nodes[path] = len(nodes)
+    lights = tuple(light for light in lights if light.shape in nodes and light.transform in nodes)
+
+    columns = {attribute: [] for attribute in attributes}
+    for light in lights:
+        shape = om.MFnDependencyNode(selection.getDependNode(nodes[light.shape]))
+        transform = om.MFnDependencyNode(selection.getDependNode(nodes[light.transform]))
+        for attribute in attributes:
+            node = transform if attribute in TRANSFORM_ATTRIBUTES else shape
+            try:
+                value = PLUG_READERS[attribute](node.findPlug(attribute, False))
+            except RuntimeError:
+                value = None
+            columns[attribute].append(value)
+    return LightSnapshot(lights, {attribute: tuple(values) for attribute, values in columns.items()})
+
+
+@contextmanager
+def undo_chunk(name: str):
+    """
+    Groups every Maya command run inside the block into a single named undo step.
+
+    Args:
+        name (str): The name of the undo step, as shown in Maya's undo history.
+    """
+    cmds.undoInfo(openChunk=True, chunkName=name)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def undoable(name: str):
+    """
+    Decorator running a function inside `undo_chunk`, so one Ctrl+Z reverts everything it did in Maya.
+
+    Args:
+        name (str): The name of the undo step.
+    """
+    def decorator(func: object) -> object:
+        @wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            with undo_chunk(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
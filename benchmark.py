@@ -0,0 +1,388 @@
+'''
+Scaling benchmark of the Light Manager, run outside Maya.
+
+The manager runs against the in-memory scene of FakeMaya under an offscreen
+Qt platform (a Qt binding such as PySide2/PySide6 must be installed). Each
+operation is timed at every scene size and the results are printed (or
+written) as JSON, so that regressions can be tracked between versions.
+
+The Maya calls of every operation are counted (LightProfiler.CALLS) and
+the commands over their LightProfiler.CALL_BUDGETS are reported, as well as
+the undo chunks opened by every step. Both are enforced by the tests
+(test_call_budgets.py, test_undo_chunks.py), which run in seconds.
+
+The bulk snapshot reader (MayaLightScene.read_snapshot) is timed against
+the per-light `cmds.getAttr` reads it replaced, on every listed light, and
+the table rows (built and first painted) against the per-cell widgets with
+their own stylesheets the table used before (up to ROW_BUILD_BASELINE_MAX).
+
+With --leak-check, the manager is also opened and closed repeatedly: the
+script fails if a Maya callback or a window survives, or if the memory keeps
+growing once warmed up.
+
+With --startup, the time from a cold interpreter to the first paint of the
+window is measured, as well as a warm relaunch reusing the window.
+
+    python benchmark.py
+    python benchmark.py --sizes 10 100 1000 10000 --output bench.json
+    python benchmark.py --sizes 100 --leak-check
+    python benchmark.py --sizes 1000 --startup
+'''
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import weakref
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import FakeMaya
+
+FakeMaya.install()
+
+from maya import cmds
+
+import Qt
+from Qt.QtCore import QEvent
+from Qt.QtWidgets import (QApplication, QCheckBox, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget,
+                          QTableWidgetItem, QWidget)
+
+import LightManagerUI as lmui
+import MayaLightLogic as mll
+import mlm_main
+from LightProfiler import CALLS
+from MayaLightScene import SNAPSHOT_ATTRIBUTES, TRANSFORM_ATTRIBUTES, read_snapshot, scan_lights
+
+SIZES = [10, 100, 1000, 10000]
+OPERATIONS = {  # BENCHMARK STEP -> OPERATION WHOSE CALLS ARE COUNTED (OTHER STEPS: EVERY FAKE MAYA CALL)
+    "refresh_full": "refresh", "refresh_unchanged": "refresh",
+    "refresh_added": "refresh", "refresh_removed": "refresh",
+    "search": "search_light", "search_narrowed": "search_light", "search_clear": "search_light",
+    "solo": "update_all_lights_visibility", "solo_switch": "update_all_lights_visibility",
+    "unsolo": "update_all_lights_visibility",
+    "adjust_exposure": "adjust_lights", "adjust_samples": "adjust_lights",
+    "adjust_color": "adjust_lights", "adjust_normalize": "adjust_lights",
+    "create": "create_light", "rename": "rename_light", "delete": "delete",
+}
+REFRESH_CHANGE = 10  # LIGHTS CREATED, THEN DELETED, OUTSIDE THE MANAGER: THE REFRESH COST MUST NOT GROW WITH THE SCENE
+ROW_BUILD_BASELINE_MAX = 1000  # LARGEST SCENE THE PER-WIDGET BASELINE OF THE ROW BUILD IS TIMED ON (~30 S AT 1000)
+LEAK_CYCLES = 100  # OPEN/CLOSE CYCLES OF THE LEAK CHECK
+LEAK_WARMUP = 10  # CYCLES RUN BEFORE MEASURING THE MEMORY (CACHES, IMPORTS, ...)
+LEAK_TOLERANCE_KB = 1024  # MEMORY GROWTH ALLOWED OVER THE MEASURED CYCLES
+STARTUP_RUNS = 5  # COLD STARTS, THE FASTEST IS KEPT
+# RUN IN A FRESH INTERPRETER: IMPORTS THE MANAGER AND SHOWS IT, THEN PRINTS THE ELAPSED MS
+STARTUP_SCRIPT = '''
+import time
+start = time.perf_counter()
+import os, sys
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import FakeMaya
+FakeMaya.install().populate({size})
+import mlm_main
+from Qt.QtWidgets import QApplication
+app = QApplication.instance() or QApplication(sys.argv)
+mlm_main.show()
+app.processEvents()
+print((time.perf_counter() - start) * 1000)
+'''
+
+
+def timed(function: object, *args: object) -> float:
+    """ Runs a function and returns its duration in milliseconds. """
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def read_per_light(lights: list) -> list:
+    """ Reads the displayed attributes the way rows used to be built: one `cmds.getAttr` per light and attribute. """
+    rows = []
+    for light in lights:
+        row = {}
+        for attribute in SNAPSHOT_ATTRIBUTES:
+            node = light.transform if attribute in TRANSFORM_ATTRIBUTES else light.shape
+            try:
+                row[attribute] = cmds.getAttr(f"{node}.{attribute}")
+            except ValueError:  # MISSING ATTRIBUTE (e.g. ARNOLD NOT LOADED)
+                row[attribute] = None
+        rows.append(row)
+    return rows
+
+
+def settle(app: QApplication, logic: mll.MayaLightLogic):
+    """ Processes the events until the chunked work scheduled on the event loop is done. """
+    app.processEvents()
+    while logic.search_rows or logic.pending_lights:
+        app.processEvents()
+
+
+def run(app: QApplication, size: int) -> dict:
+    """
+    Times every operation of the manager on a fresh scene of `size` lights.
+
+    Returns:
+        dict: The duration of each operation in milliseconds, the Maya calls it made per command,
+            the commands that went over their budget and the undo chunks it opened.
+    """
+    scene = FakeMaya.reset()
+    scene.populate(size)
+    ui = lmui.LightManagerUI()
+    logic = mll.MayaLightLogic(ui)
+    table = ui.light_table
+    model = table.model()
+    results = {}
+
+    def measure(name: str, function: object, *args: object):
+        CALLS.reset()
+        chunks, calls = len(scene.undo_chunks), dict(scene.calls)
+        duration = timed(function, *args)
+        operation = OPERATIONS.get(name)
+        if operation is None:  # NOT A MANAGER OPERATION: COUNT EVERY CALL MADE, WITHOUT BUDGET
+            maya_calls = {command: count - calls.get(command, 0) for command, count in scene.calls.items()
+                          if count != calls.get(command, 0)}
+            budget = {}
+        else:
+            maya_calls, budget = CALLS.calls(operation), CALLS.over_budget(operation)
+        results[name] = {"ms": round(duration, 3), "maya_calls": maya_calls,
+                         "over_budget": budget, "undo_chunks": scene.undo_chunks[chunks:]}
+        settle(app, logic)
+
+    measure("refresh_full", lambda: (logic.refresh(table), settle(app, logic)))
+    measure("refresh_unchanged", logic.refresh, table)
+    for index in range(REFRESH_CHANGE):
+        scene.create_light(FakeMaya.LIGHT_TYPES[index % len(FakeMaya.LIGHT_TYPES)], f"LGT_ADDED_{index:03d}")
+    measure("refresh_added", lambda: (logic.refresh(table), settle(app, logic)))
+    scene.delete([logic.scene_lights[model.light_key(row)].transform for row in range(REFRESH_CHANGE)])
+    measure("refresh_removed", logic.refresh, table)
+    lights = [logic.scene_lights[key] for key in logic.scene_lights]
+    measure("read_per_light", read_per_light, lights)
+    measure("read_snapshot", read_snapshot, lights)
+    measure("search", lambda: (logic.search_light("spot", table), settle(app, logic)))
+    measure("search_narrowed", lambda: (logic.search_light("spotl", table), settle(app, logic)))
+    measure("search_clear", lambda: (logic.search_light("", table), settle(app, logic)))
+    measure("solo", logic.light_edited, model.light_key(0), "solo", True, table)
+    measure("solo_switch", logic.light_edited, model.light_key(1), "solo", True, table)
+    measure("unsolo", logic.light_edited, model.light_key(1), "solo", False, table)
+    table.selectAll()  # ADJUSTMENTS APPLY TO EVERY LIGHT
+    measure("adjust_exposure", logic.adjust_lights, "exposure", "0.5", table)
+    measure("adjust_samples", logic.adjust_lights, "samples", "2", table)
+    measure("adjust_color", logic.adjust_lights, "color", "1 0.9 0.8", table)
+    measure("adjust_normalize", logic.adjust_lights, "normalize", "", table)
+    table.clearSelection()
+    measure("create", logic.create_light, "bench", "spotLight", table)
+    measure("rename", logic.rename_light, model.light_key(0), "RENAMED", table)
+    table.selectRow(model.rowCount() - 1)
+    measure("delete", logic.delete, table)
+
+    ui.close()
+    logic.shutdown()
+    ui.deleteLater()
+    logic.deleteLater()
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    return results
+
+
+def build_widget_rows(table: QTableWidget, lights: list, snapshot: object):
+    """
+    Builds the rows the way the table used to: one widget per cell, each styled with its own stylesheet.
+
+    Only the Qt side is reproduced: the values come from `snapshot`, without any Maya call.
+    """
+    def centered(widget: QWidget) -> QWidget:
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.addWidget(widget)
+        layout.setAlignment(Qt.QtCore.Qt.AlignCenter)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return container
+
+    for index, light in enumerate(snapshot.lights):
+        values = snapshot.row(index)
+        row = table.rowCount()
+        table.insertRow(row)
+        name_item = QTableWidgetItem(light.name)
+        name_item.setTextAlignment(Qt.QtCore.Qt.AlignCenter | Qt.QtCore.Qt.AlignVCenter)
+        table.setItem(row, 0, name_item)
+        mute_checkbox = QCheckBox()
+        mute_checkbox.setStyleSheet("QCheckBox::indicator:unchecked { background-color: #f94144 }")
+        mute_checkbox.setChecked(bool(values["visibility"]))
+        table.setCellWidget(row, 1, centered(mute_checkbox))
+        solo_checkbox = QCheckBox()
+        solo_checkbox.setStyleSheet("QCheckBox::indicator:checked { background-color: #adb5bd }")
+        table.setCellWidget(row, 2, centered(solo_checkbox))
+        icon = QLabel()
+        icon.setPixmap(lmui.light_icon(light.node_type))
+        icon.setAlignment(Qt.QtCore.Qt.AlignCenter | Qt.QtCore.Qt.AlignVCenter)
+        table.setCellWidget(row, 3, icon)
+        color_button = QPushButton()
+        color_button.setFixedSize(40, 20)
+        r, g, b = (int(channel * 255) for channel in values["color"])
+        color_button.setStyleSheet(f"background-color: rgba({r},{g},{b}, 1.0)")
+        table.setCellWidget(row, 4, centered(color_button))
+        for column, attribute in ((5, "aiExposure"), (6, "aiSamples"), (7, "aiAov")):
+            entry = QLineEdit(str(values[attribute]))
+            entry.setAlignment(Qt.QtCore.Qt.AlignCenter)
+            table.setCellWidget(row, column, entry)
+
+
+def row_build(app: QApplication, size: int) -> dict:
+    """
+    Times building the rows of `size` lights, up to the first paint of the table.
+
+    Returns:
+        dict: The duration in milliseconds with the table model (the manager's `add_lights`), and with
+            the per-cell widgets it replaced (None above ROW_BUILD_BASELINE_MAX lights).
+    """
+    scene = FakeMaya.reset()
+    scene.populate(size)
+    lights = scan_lights(FakeMaya.LIGHT_TYPES)
+    snapshot = read_snapshot(lights)
+    rows = [dict(snapshot.row(index), key=light.uuid, name=light.name, node_type=light.node_type,
+                 icon=lmui.light_icon(light.node_type), solo=False)
+            for index, light in enumerate(snapshot.lights)]
+
+    ui = lmui.LightManagerUI()
+    ui.show()
+    app.processEvents()
+    model = timed(lambda: (ui.light_table.model().add_lights(rows), app.processEvents()))
+    table_size = ui.light_table.size()
+    ui.close()
+    ui.deleteLater()
+
+    widgets = None
+    if size <= ROW_BUILD_BASELINE_MAX:
+        table = QTableWidget(0, len(lmui.TABLE_HEADER))
+        table.setStyleSheet("QTableWidget { background-color: #222b33 ; color: white; }")
+        table.resize(table_size)
+        table.show()
+        app.processEvents()
+        widgets = timed(lambda: (build_widget_rows(table, lights, snapshot), app.processEvents()))
+        table.close()
+        table.deleteLater()
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    return {"model_ms": round(model, 3), "per_widget_ms": None if widgets is None else round(widgets, 3)}
+
+
+def leak_check(app: QApplication, size: int, cycles: int = LEAK_CYCLES) -> dict:
+    """
+    Opens and closes the manager `cycles` times on a scene of `size` lights, as a user would.
+
+    Returns:
+        dict: The most Maya callbacks left registered after a close, the windows built by the cycles
+            still alive at the end, and the memory growth (KB) between the end of the warm-up and the last cycle.
+    """
+    scene = FakeMaya.reset()
+    scene.populate(size)
+    callbacks = 0
+    windows = []  # WEAK REFERENCES TO THE WINDOWS BUILT, SO THAT ONLY THEY ARE COUNTED
+    baseline = 0
+    tracemalloc.start()
+    for cycle in range(cycles):
+        ui = mlm_main.getMayaMainWindow()
+        mlm_main.ui = mlm_main.logic = None  # BUILD A NEW WINDOW EVERY CYCLE
+        windows.append(weakref.ref(ui))
+        app.processEvents()
+        ui.close()
+        callbacks = max(callbacks, len(scene.callbacks))
+        ui.deleteLater()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+        del ui
+        gc.collect()
+        if cycle == LEAK_WARMUP - 1:
+            baseline = tracemalloc.get_traced_memory()[0]
+    growth = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return {
+        "cycles": cycles,
+        "callbacks": callbacks,
+        "windows": sum(window() is not None for window in windows),
+        "memory_growth_kb": round(growth / 1024, 1),
+    }
+
+
+def startup(app: QApplication, size: int, runs: int = STARTUP_RUNS) -> dict:
+    """
+    Times the launch of the manager on a scene of `size` lights, up to the first paint of its window.
+
+    Returns:
+        dict: The fastest cold start (fresh interpreter) and the warm relaunch of a closed window,
+            in milliseconds.
+    """
+    cold = min(float(subprocess.run([sys.executable, "-c", STARTUP_SCRIPT.format(size=size)],
+                                    cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+                                    capture_output=True, text=True).stdout.split()[-1])
+               for _ in range(runs))
+
+    scene = FakeMaya.reset()
+    scene.populate(size)
+    mlm_main.ui = mlm_main.logic = None
+    mlm_main.show()
+    app.processEvents()
+    mlm_main.ui.close()
+    start = time.perf_counter()
+    mlm_main.show()
+    app.processEvents()
+    warm = (time.perf_counter() - start) * 1000
+    mlm_main.ui.close()
+    mlm_main.ui.deleteLater()
+    mlm_main.ui = mlm_main.logic = None
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    return {
+        "cold_ms": round(cold, 3),
+        "warm_relaunch_ms": round(warm, 3),
+    }
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Scene sizes, in lights.")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout.")
+    parser.add_argument("--leak-check", action="store_true", help="Also open and close the manager repeatedly.")
+    parser.add_argument("--startup", action="store_true", help="Also time the launch of the manager.")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    CALLS.enable()
+    report = {
+        "python": platform.python_version(),
+        "binding": Qt.__binding__,
+        "results": {str(size): run(app, size) for size in args.sizes},
+        "row_build": {str(size): row_build(app, size) for size in args.sizes},
+    }
+    if args.leak_check:
+        report["leaks"] = {str(size): leak_check(app, size) for size in args.sizes}
+    if args.startup:
+        report["startup"] = {str(size): startup(app, size) for size in args.sizes}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text)
+    else:
+        print(text)
+    return report
+
+
+def leaks(report: dict) -> list:
+    """ Returns a line per leak found by the leak check of a report. """
+    failures = []
+    for size, leak in report.get("leaks", {}).items():
+        if leak["callbacks"]:
+            failures.append(f"{size}: {leak['callbacks']} Maya callbacks survived a close")
+        if leak["windows"]:
+            failures.append(f"{size}: {leak['windows']} windows still alive")
+        if leak["memory_growth_kb"] > LEAK_TOLERANCE_KB:
+            failures.append(f"{size}: memory grew by {leak['memory_growth_kb']} KB > {LEAK_TOLERANCE_KB} KB")
+    return failures
+
+
+if __name__ == "__main__":
+    report = main()
+    failures = leaks(report)
+    if failures:
+        sys.exit("Benchmark checks failed:\n" + "\n".join(failures))
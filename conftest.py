@@ -0,0 +1,52 @@
+"""
+Fixtures running the Light Manager outside Maya, on the in-memory scene of FakeMaya.
+
+The fake Maya modules are installed before any test module imports the
+manager, and the windows are built under an offscreen Qt platform. The tests
+need a Qt binding (PySide2/PySide6) and are skipped without one.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import FakeMaya
+
+FakeMaya.install()
+
+SCENE_LIGHTS = 300  # MORE THAN ONE POPULATE CHUNK, SO THE LISTING GOES THROUGH THE EVENT LOOP
+
+
+@pytest.fixture(scope="session")
+def app():
+    """ The Qt application shared by every test. """
+    from Qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def scene():
+    """ A fresh fake scene of `SCENE_LIGHTS` lights. """
+    scene = FakeMaya.reset()
+    scene.populate(SCENE_LIGHTS)
+    return scene
+
+
+@pytest.fixture
+def manager(app, scene):
+    """ A Light Manager listing every light of `scene`; its window is at `manager.ui`. """
+    import LightManagerUI as lmui
+    import MayaLightLogic as mll
+    from benchmark import settle
+
+    ui = lmui.LightManagerUI()
+    logic = mll.MayaLightLogic(ui)
+    logic.refresh(ui.light_table)
+    settle(app, logic)
+    yield logic
+    ui.close()
+    logic.shutdown()
+    ui.deleteLater()
+    logic.deleteLater()
+    app.processEvents()
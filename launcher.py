@@ -2,17 +2,16 @@
 Copy the script in Maya script editor (python).
 change the PATH to yours
 Drag and Drop the script in your Maya shelf.
+(Shelf buttons made from the previous version, which reload mlm_main, still work.)
 Enjoy !
 '''
 
 import sys
-from importlib import reload
 
 directory = r"YOUR_PATH\Maya_Light_Manager"
 if directory not in sys.path:
     sys.path.append(directory)
 
 import mlm_main
-reload(mlm_main)
-mlm_main
+mlm_main.show()  # RAISES THE OPEN WINDOW INSTEAD OF BUILDING A NEW ONE
 print("Launched Maya Light Manager.")
@@ -17,13 +17,16 @@
 
 import os
 
+from Qt import QtCompat
 from Qt.QtGui import QPixmap
 
 import LightManagerUI as lmui
 import MayaLightLogic as mll
 
-logic = None
-ui = None
+# `reload(mlm_main)` RUNS THIS MODULE AGAIN IN ITS OWN NAMESPACE: KEEP THE RUNNING INSTANCE THROUGH IT
+RELOADED = "show" in globals()
+logic = globals().get("logic")  # THE RUNNING INSTANCE, KEPT FOR THE WHOLE MAYA SESSION (SEE `show`)
+ui = globals().get("ui")
 
 
 def getMayaMainWindow() -> lmui.LightManagerUI:
@@ -57,13 +60,47 @@ def getMayaMainWindow() -> lmui.LightManagerUI:
     ui.signal_table_selection.connect(logic.light_table_selection)
     ui.signal_light_created.connect(logic.create_light)
     ui.signal_light_renamed.connect(logic.rename_light)
+    ui.signal_batch_rename_preview.connect(logic.preview_batch_rename)
+    ui.signal_batch_rename.connect(logic.batch_rename)
+    ui.signal_light_edited.connect(logic.light_edited)
+    ui.signal_light_color.connect(logic.set_color)
+    ui.signal_light_adjusted.connect(logic.adjust_lights)
     ui.signal_light_search.connect(logic.search_light)
     ui.button_render.clicked.connect(logic.render)
     ui.signal_light_deleted.connect(logic.delete)
     ui.signal_refresh.connect(logic.refresh)
+    # RELEASE EVERY MAYA CALLBACK WHEN THE WINDOW GOES AWAY
+    ui.signal_closed.connect(logic.shutdown)
+    ui.destroyed.connect(logic.window_destroyed)  # A BOUND METHOD: NOTHING KEEPS THE LOGIC ALIVE AFTERWARDS
     logic.refresh(ui.light_table)  # INITIAL REFRESH TO LOAD LIGHTS
 
     ui.show()
+    return ui
 
 
-getMayaMainWindow()
+def show() -> lmui.LightManagerUI:
+    """
+    Shows the Maya Light Manager, reusing the running instance if there is one.
+
+    The first call builds the window (`getMayaMainWindow`). The next ones only
+    raise the existing window and refresh it: an open window only gets the
+    lights that changed in the scene since, and a closed one (which released
+    its lights and callbacks) is restarted and refilled, without being rebuilt.
+
+    Returns:
+        LightManagerUI: The Light Manager window.
+    """
+    if ui is None or not QtCompat.isValid(ui):
+        return getMayaMainWindow()
+
+    logic.start()  # NO-OP IF THE WINDOW IS STILL OPEN
+    logic.refresh(ui.light_table)  # INCREMENTAL SYNC WITH THE SCENE
+    ui.showNormal()  # ALSO RESTORES A MINIMIZED WINDOW
+    ui.raise_()
+    ui.activateWindow()
+    return ui
+
+
+if RELOADED:
+    # SHELF BUTTONS MADE FOR THE OLD LAUNCHER (`import mlm_main; reload(mlm_main)`) OPEN THE MANAGER THROUGH A RELOAD
+    show()
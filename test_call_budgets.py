@@ -0,0 +1,104 @@
+"""
+The Maya calls of every operation stay within `LightProfiler.CALL_BUDGETS`, whatever the number of lights.
+"""
+import pytest
+
+pytest.importorskip("Qt", reason="needs a Qt binding (PySide2/PySide6)")
+
+from benchmark import settle
+from LightProfiler import CALLS
+import FakeMaya
+
+
+@pytest.fixture
+def calls():
+    """ Counts the Maya calls for the duration of a test. """
+    enabled = CALLS.enabled
+    CALLS.enable()
+    CALLS.reset()
+    yield CALLS
+    CALLS.enable(enabled)
+    CALLS.reset()
+
+
+def over_budget(operation: str, function: object, *args: object) -> dict:
+    """ Runs an action and returns the commands `operation` called more often than its budget allows. """
+    CALLS.reset()
+    function(*args)
+    return CALLS.over_budget(operation)
+
+
+def test_refresh(app, scene, calls, manager):
+    table = manager.ui.light_table
+    assert over_budget("refresh", manager.refresh, table, True) == {}  # FULL RESCAN
+    assert over_budget("refresh", manager.refresh, table) == {}  # NOTHING CHANGED
+    for index in range(10):
+        scene.create_light(FakeMaya.LIGHT_TYPES[index % len(FakeMaya.LIGHT_TYPES)], f"LGT_ADDED_{index:03d}")
+    assert over_budget("refresh", manager.refresh, table) == {}
+    scene.delete([f"LGT_ADDED_{index:03d}" for index in range(10)])
+    assert over_budget("refresh", manager.refresh, table) == {}
+
+
+def test_populate_rows(app, scene, calls, manager):
+    listed = len(manager.scene_lights)
+    scene.populate(listed)  # MORE ROWS THAN THE FIRST CHUNK, ADDED ON THE EVENT LOOP
+    manager.refresh(manager.ui.light_table)
+    assert over_budget("populate_rows", settle, app, manager) == {}
+    assert manager.ui.light_table.model().rowCount() == 2 * listed
+
+
+def test_search_light(app, calls, manager):
+    table = manager.ui.light_table
+    for text in ("spot", "spotl", ""):
+        CALLS.reset()
+        manager.search_light(text, table)
+        settle(app, manager)
+        assert CALLS.over_budget("search_light") == {}
+
+
+def test_solo(calls, manager):
+    table = manager.ui.light_table
+    model = table.model()
+    for row, state in ((0, True), (1, True), (1, False)):  # SOLO, SWITCH, UNSOLO
+        assert over_budget("update_all_lights_visibility", manager.light_edited,
+                           model.light_key(row), "solo", state, table) == {}
+
+
+def test_solo_switch(calls, manager):
+    table = manager.ui.light_table
+    model = table.model()
+    manager.light_edited(model.light_key(0), "solo", True, table)
+    CALLS.reset()
+    manager.light_edited(model.light_key(1), "solo", True, table)
+    # THE TWO LIGHTS WHOSE VISIBILITY CHANGES, AND THE SAVED STATE: NOTHING PER LISTED LIGHT
+    assert CALLS.calls("update_all_lights_visibility").get("setAttr") == 3
+
+
+@pytest.mark.parametrize("light_type", ["spotLight", "aiAreaLight"])
+def test_create_light(calls, manager, light_type):
+    assert over_budget("create_light", manager.create_light, "key", light_type, manager.ui.light_table) == {}
+
+
+def test_rename_light(calls, manager):
+    table = manager.ui.light_table
+    assert over_budget("rename_light", manager.rename_light, table.model().light_key(0), "rim", table) == {}
+
+
+def test_batch_rename(calls, manager):
+    table = manager.ui.light_table
+    table.selectAll()
+    assert over_budget("batch_rename", manager.batch_rename, "LGT_", "KEY_", False, table) == {}
+
+
+def test_delete(calls, manager):
+    table = manager.ui.light_table
+    table.selectAll()
+    assert over_budget("delete", manager.delete, table) == {}
+
+
+@pytest.mark.parametrize("operation, value", [("exposure", "0.5"), ("samples", "2"), ("color", "1 0.9 0.8"),
+                                              ("normalize", "")])
+def test_adjust_lights(calls, manager, operation, value):
+    table = manager.ui.light_table
+    table.selectAll()
+    assert over_budget("adjust_lights", manager.adjust_lights, operation, value, table) == {}
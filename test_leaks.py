@@ -0,0 +1,14 @@
+"""
+Closing the manager releases every Maya callback it registered, and its window, cycle after cycle.
+"""
+import pytest
+
+pytest.importorskip("Qt", reason="needs a Qt binding (PySide2/PySide6)")
+
+from benchmark import LEAK_CYCLES, leak_check
+
+
+def test_open_close(app):
+    leaks = leak_check(app, 20, cycles=LEAK_CYCLES)
+    assert leaks["callbacks"] == 0
+    assert leaks["windows"] == 0
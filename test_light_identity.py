@@ -0,0 +1,89 @@
+"""
+Lights keep their key, row and callbacks through duplicate short names, shared UUIDs, reparenting and group renames.
+"""
+import pytest
+
+pytest.importorskip("Qt", reason="needs a Qt binding (PySide2/PySide6)")
+
+from maya import cmds
+
+from benchmark import settle
+from LightMuteSolo import read_state
+
+
+def listed(manager: object, *paths: str) -> list:
+    """ Returns the keys of the listed lights whose transform is at one of `paths`, in that order. """
+    keys = {manager.scene_lights[key].transform: key for key in manager.scene_lights}
+    return [keys.get(path) for path in paths]
+
+
+def groups(*names: str) -> list:
+    """ Creates empty groups at the root of the scene; returns their names. """
+    return [cmds.createNode("transform", name=name) for name in names]
+
+
+def test_duplicate_short_names(app, scene, manager):
+    table = manager.ui.light_table
+    groups("a", "b")
+    scene.create_light("spotLight", "LGT_KEY_000", parent="a")
+    scene.create_light("spotLight", "LGT_KEY_000", parent="b")
+    manager.refresh(table)
+    settle(app, manager)
+
+    key_a, key_b = listed(manager, "|a|LGT_KEY_000", "|b|LGT_KEY_000")
+    assert None not in (key_a, key_b) and key_a != key_b
+    model = table.model()
+    assert model.light_name(model.light_row(key_a)) == model.light_name(model.light_row(key_b)) == "LGT_KEY_000"
+
+    manager.light_edited(key_b, "aiExposure", "2", table)
+    assert cmds.getAttr("|a|LGT_KEY_000|LGT_KEY_000Shape.aiExposure") == 0.0
+    assert cmds.getAttr("|b|LGT_KEY_000|LGT_KEY_000Shape.aiExposure") == 2.0
+
+
+def test_shared_uuids(app, scene, manager):
+    table = manager.ui.light_table
+    # THE SAME FILE REFERENCED TWICE: BOTH COPIES HAVE THE SAME UUIDS, IN THEIR OWN NAMESPACE
+    scene.create_light("aiAreaLight", "ref2:LGT_FILL_000")
+    scene.create_light("aiAreaLight", "ref1:LGT_FILL_000")
+    uuid = scene.node("ref2:LGT_FILL_000").uuid = scene.node("ref1:LGT_FILL_000").uuid
+    manager.refresh(table)
+    settle(app, manager)
+
+    key_1, key_2 = listed(manager, "|ref1:LGT_FILL_000", "|ref2:LGT_FILL_000")
+    # THE KEYS DO NOT DEPEND ON THE SCAN ORDER OR THE SESSION, SO THE SAVED STATE FINDS ITS LIGHTS ON REOPEN
+    assert (key_1, key_2) == (f"{uuid}:ref1", f"{uuid}:ref2")
+    assert table.model().light_row(key_1) != table.model().light_row(key_2)
+    manager.light_edited(key_2, "visibility", False, table)
+    assert read_state()["muted"] == [key_2]
+    manager.refresh(table, True)
+    assert listed(manager, "|ref1:LGT_FILL_000", "|ref2:LGT_FILL_000") == [key_1, key_2]
+
+
+def test_reparenting(app, scene, manager):
+    table = manager.ui.light_table
+    model = table.model()
+    key = model.light_key(0)
+    rows = model.rowCount()
+    group, = groups("LIGHTS")
+    cmds.parent(manager.scene_lights[key].transform, group)
+    light = manager.scene_lights[key]
+    assert light.transform.startswith("|LIGHTS|") and light.shape.startswith(light.transform + "|")
+
+    manager.refresh(table)
+    assert model.rowCount() == rows and model.light_row(key) == 0
+    # THE CALLBACKS OF THE LIGHT FOLLOWED IT
+    cmds.setAttr(f"{light.shape}.aiExposure", 3.0)
+    manager.updates.flush()
+    assert model.lights[0]["aiExposure"] == 3.0
+
+
+def test_parent_group_rename(app, scene, manager):
+    table = manager.ui.light_table
+    model = table.model()
+    keys = [model.light_key(row) for row in range(3)]
+    group, = groups("LIGHTS")
+    cmds.parent([manager.scene_lights[key].transform for key in keys], group)
+    cmds.rename(group, "KEY_LIGHTS")
+    assert all(manager.scene_lights[key].transform.startswith("|KEY_LIGHTS|") for key in keys)
+    # ONLY THE LIGHTS BELOW THE GROUP WERE MARKED STALE
+    assert manager.scene_lights.stale <= set(keys)
@@ -0,0 +1,74 @@
+"""
+Every operation changing the Maya scene opens exactly one undo chunk, so one Ctrl+Z reverts all of it.
+"""
+import pytest
+
+pytest.importorskip("Qt", reason="needs a Qt binding (PySide2/PySide6)")
+
+from benchmark import settle
+from MayaLightScene import read_snapshot
+
+
+def undo_chunks(scene: object, function: object, *args: object) -> list:
+    """ Runs an operation and returns the names of the outermost undo chunks it opened. """
+    start = len(scene.undo_chunks)
+    function(*args)
+    return scene.undo_chunks[start:]
+
+
+def test_delete(scene, manager):
+    table = manager.ui.light_table
+    table.selectAll()
+    assert undo_chunks(scene, manager.delete, table) == ["Light Manager: Delete Light"]
+    assert table.model().rowCount() == 0
+
+
+@pytest.mark.parametrize("light_type", ["spotLight", "aiAreaLight"])
+def test_create(scene, manager, light_type):
+    table = manager.ui.light_table
+    assert undo_chunks(scene, manager.create_light, "key", light_type, table) == ["Light Manager: Create Light"]
+
+
+def test_rename(scene, manager):
+    table = manager.ui.light_table
+    light_key = table.model().light_key(0)
+    assert undo_chunks(scene, manager.rename_light, light_key, "rim", table) == ["Light Manager: Rename Light"]
+
+
+def test_batch_rename(scene, manager):
+    table = manager.ui.light_table
+    table.selectAll()
+    assert undo_chunks(scene, manager.batch_rename, "LGT_", "KEY_", False, table) == ["Light Manager: Batch Rename"]
+    assert all(light.name.startswith("KEY_") for light in map(manager.scene_lights.get, manager.scene_lights))
+
+
+def test_solo(scene, manager):
+    table = manager.ui.light_table
+    model = table.model()
+    for row, state in ((0, True), (1, True), (1, False)):  # SOLO, SWITCH, UNSOLO
+        chunks = undo_chunks(scene, manager.light_edited, model.light_key(row), "solo", state, table)
+        assert chunks == ["Light Manager: Edit Light"]
+
+
+@pytest.mark.parametrize("operation, value, chunk", [
+    ("exposure", "0.5", "Light Manager: Add Exposure"),
+    ("samples", "2", "Light Manager: Scale Samples"),
+    ("color", "1 0.9 0.8", "Light Manager: Multiply Color"),
+    ("normalize", "", "Light Manager: Normalize Intensities"),
+])
+def test_adjust(scene, manager, operation, value, chunk):
+    table = manager.ui.light_table
+    table.selectAll()
+    assert undo_chunks(scene, manager.adjust_lights, operation, value, table) == [chunk]
+
+
+def test_listing_under_solo(app, scene, manager):
+    table = manager.ui.light_table
+    manager.light_edited(table.model().light_key(0), "solo", True, table)
+    scene.populate(3 * len(manager.scene_lights))  # LISTED IN SEVERAL CHUNKS, ALL HIDDEN BY THE SOLO
+    start = len(scene.undo_chunks)
+    manager.refresh(table)
+    settle(app, manager)
+    assert scene.undo_chunks[start:] == ["Light Manager: Refresh", "Light Manager: Solo"]
+    snapshot = read_snapshot([manager.scene_lights[key] for key in manager.scene_lights], ["visibility"])
+    assert sum(snapshot.columns["visibility"]) == 1